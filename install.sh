@@ -62,13 +62,10 @@ install_dependencies_stepwise() {
     # Upgrade pip first
     pip install --upgrade pip
 
-    # Install setuptools first (required for Python 3.13+)
-    echo "  Installing setuptools..."
-    pip install setuptools
-
     # Install non-problematic dependencies first
     echo "  Installing core dependencies..."
     pip install "openai>=1.0.0"
+    pip install "httpx[http2]>=0.23.0"
     pip install "google-genai>=0.1.0"
     pip install "numpy>=1.20.0"
     pip install "rich>=13.0.0"
@@ -154,7 +151,7 @@ VTRANS_DIR="$VTRANS_DIR"
 
 # Activate virtual environment and run vtrans
 source "\$VTRANS_DIR/venv/bin/activate"
-python -m voicetrans.cli "\$@"
+python -m voicetrans "\$@"
 EOF
 
     # Install the wrapper script
@@ -226,7 +223,7 @@ if command -v conda &> /dev/null; then
     # Activate conda and run vtrans
     eval "$(conda shell.bash hook)"
     conda activate voicetrans
-    python -m voicetrans.cli "$@"
+    python -m voicetrans "$@"
 else
     echo "❌ Conda not found. Please ensure conda is in your PATH"
     exit 1
@@ -2,9 +2,34 @@
 VoiceTrans - Professional Real-time Voice Translator
 """
 
-__version__ = "1.0.0"
+import importlib
+from typing import TYPE_CHECKING
+
 __author__ = "VoiceTrans"
 
-from .app import FireworksVoiceTranslator
+__all__ = ['FireworksVoiceTranslator']
+
+if TYPE_CHECKING:
+    from .app import FireworksVoiceTranslator as FireworksVoiceTranslator  # for IDEs/mypy only
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY = {
+    'FireworksVoiceTranslator': '.app',
+}
+
+
+def __getattr__(name):
+    if name == '__version__':
+        # _version.py is the single source (pyproject.toml reads it) and imports nothing
+        from ._version import __version__ as value
+        globals()[name] = value
+        return value
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['FireworksVoiceTranslator']
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {'__version__'})
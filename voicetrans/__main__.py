@@ -0,0 +1,8 @@
+"""
+Allow running VoiceTrans with ``python -m voicetrans``
+"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
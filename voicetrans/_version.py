@@ -0,0 +1,3 @@
+"""VoiceTrans version; kept import-free so `vtrans --version` stays instant"""
+
+__version__ = "1.0.0"
@@ -6,25 +6,43 @@ Ultra-low latency implementation for seamless translation
 
 import sys
 import os
+import asyncio
 import threading
 import queue
 import time
 import json
+import hashlib
+import struct
+import selectors
+from bisect import bisect_right
+from enum import IntEnum
 import numpy as np
-import pyaudio
-import wave
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from collections import deque
-import io
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from itertools import islice
 
-# Audio processing
-import webrtcvad
+# Audio capture and processing (optional "audio" extra)
+try:
+    import pyaudio
+except ImportError:
+    pyaudio = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# Optional JIT for the per-chunk audio level/peak ("fast" extra)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Fireworks AI via OpenAI client
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
 
 # Google Gemini for translation
 try:
@@ -45,6 +63,169 @@ from rich import box
 from rich.columns import Columns
 from rich.syntax import Syntax
 
+def _wav_header(sample_rate, data_size):
+    """44-byte RIFF header for mono 16-bit PCM"""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, 1,
+        sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+
+# Fixed translation instructions; identical on every call so the provider can reuse the prompt prefix
+_TRANSLATE_SYSTEM = (
+    "You are a translator. Translate the user's text into the target language given on its "
+    "first line. Output only the translation, nothing else."
+)
+
+# Fireworks low-latency audio endpoint (OpenAI-compatible)
+_FIREWORKS_BASE_URL = "https://audio-prod.us-virginia-1.direct.fireworks.ai/v1"
+
+# Seconds of API idleness after which a keepalive request is sent, so proxies
+# don't reap the pooled connection between utterances
+_KEEPALIVE_INTERVAL = 30
+
+# 0.5s of 16kHz silence, used once to validate the Fireworks connection
+_SILENT_TEST_WAV = _wav_header(16000, 16000) + bytes(16000)
+
+def _audio_stats_numpy(samples, start, stop):
+    """Mean absolute amplitude and peak of samples[start:stop], both normalized to 0..1"""
+    magnitude = np.abs(samples[start:stop], dtype=np.int32)
+    return float(magnitude.mean()) / 32768.0, float(magnitude.max()) / 32768.0
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _audio_stats(samples, start, stop):
+        """Mean absolute amplitude and peak of samples[start:stop] in a single pass"""
+        total = 0
+        peak = 0
+        for i in range(start, stop):
+            value = np.int32(samples[i])
+            magnitude = -value if value < 0 else value
+            if magnitude > peak:
+                peak = magnitude
+            total += magnitude
+        return total * (1.0 / ((stop - start) * 32768.0)), peak * (1.0 / 32768.0)
+else:
+    _audio_stats = _audio_stats_numpy
+
+class HistoryStore:
+    """Fixed-capacity translation history, stored column-wise in a ring"""
+
+    def __init__(self, capacity=100, recent=5):
+        self.capacity = capacity
+        self.timestamps = [None] * capacity
+        self.time_strs = [''] * capacity  # HH:MM:SS, formatted once on append
+        self.originals_short = [''] * capacity  # Ellipsized for the history panel
+        self.translations_short = [''] * capacity
+        self.originals = [''] * capacity
+        self.translations = [''] * capacity
+        self.target_langs = [''] * capacity
+        self.api_models = [''] * capacity
+        self.speeds = [''] * capacity
+        self.latencies = np.zeros(capacity, dtype=np.float32)
+        self.words = np.zeros(capacity, dtype=np.int32)
+        self._next = 0  # Slot the next entry is written to
+        self._count = 0
+        self._recent = deque(maxlen=recent)  # Materialized rows of the newest entries, for the UI
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.tail(self._count))
+
+    def append(self, timestamp, original, translated, target_lang, latency, words, api_model, speed):
+        """Write one entry, overwriting the oldest once full"""
+        i = self._next
+        self.timestamps[i] = timestamp
+        self.time_strs[i] = timestamp.strftime('%H:%M:%S')
+        self.originals[i] = original
+        self.translations[i] = translated
+        self.originals_short[i] = self.shorten(original)
+        self.translations_short[i] = self.shorten(translated)
+        self.target_langs[i] = target_lang
+        self.latencies[i] = latency
+        self.words[i] = words
+        self.api_models[i] = api_model
+        self.speeds[i] = speed
+        self._next = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._recent.append(self.row(i))
+
+    @staticmethod
+    def shorten(text, limit=25):
+        """Cut text to limit characters with a trailing ellipsis"""
+        return text[:limit] + "..." if len(text) > limit else text
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+        self._recent.clear()
+
+    def row(self, i):
+        """Materialize the entry in slot i as a dict"""
+        return {
+            'timestamp': self.timestamps[i],
+            'time_str': self.time_strs[i],
+            'original': self.originals[i],
+            'translated': self.translations[i],
+            'orig_short': self.originals_short[i],
+            'trans_short': self.translations_short[i],
+            'target_lang': self.target_langs[i],
+            'latency': float(self.latencies[i]),
+            'words': int(self.words[i]),
+            'api_model': self.api_models[i],
+            'speed': self.speeds[i]
+        }
+
+    def latest(self, n):
+        """The last n entries (n up to `recent`), oldest first, without touching the columns"""
+        return list(islice(self._recent, max(0, len(self._recent) - n), None))
+
+    def tail(self, n):
+        """The last n entries, oldest first"""
+        n = min(n, self._count)
+        start = self._next - n
+        return [self.row((start + k) % self.capacity) for k in range(n)]
+
+class ApiState(IntEnum):
+    """Transcription API health, drawn in the status panel next to api_status (the label)"""
+    IDLE = 0  # Not connected yet, or not usable (missing/invalid key, bad endpoint)
+    OK = 1
+    ERR = 2
+
+class _Cell:
+    """Mutable table cell: persistent tables are refreshed by swapping cell values"""
+    __slots__ = ('value',)
+
+    def __init__(self, value=""):
+        self.value = value
+
+    def __rich__(self):
+        return self.value
+
+class _SessionClock:
+    """Renderable HH:MM:SS since a time.monotonic() start, current on every redraw"""
+
+    def __init__(self, start):
+        self._start = start
+
+    def __rich__(self):
+        hours, remainder = divmod(int(time.monotonic() - self._start), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+class _AudioMeter:
+    """Renderable that draws the current input level each time Live refreshes,
+    so level changes never require rebuilding the status panel"""
+
+    def __init__(self, app):
+        self._app = app
+
+    def __rich__(self):
+        return self._app.create_audio_meter()
+
 class FireworksVoiceTranslator:
     """Ultra-low latency Voice Translator"""
 
@@ -70,6 +251,45 @@ class FireworksVoiceTranslator:
         'fi': ('Finnish', '🇫🇮')
     }
 
+    # Dynamic amplitude threshold based on sensitivity mode
+    AMPLITUDE_THRESHOLDS = {
+        'Hyper-Speed': 0.003,
+        'Ultra-Fast': 0.005,
+        'Balanced': 0.008,
+        'Accurate': 0.01
+    }
+
+    METER_WIDTH = 25  # Cells in the audio level bar
+
+    CENTER_RATIOS = (4, 3)  # Translation column width, indexed by show_history
+    HISTORY_ROWS = 5  # Entries in the history panel
+    STATS_ROWS = 12  # Most rows the stats panel can show
+
+    # Counters reset by the 'c' key
+    _ZEROED_STATS = dict.fromkeys(
+        ('total_translations', 'total_words', 'total_latency', 'avg_latency',
+         'api_calls', 'api_errors', 'fireworks_savings'),
+        0
+    )
+
+    # Pricing, folded to one multiply per figure.
+    # Whisper-v3-large: $0.0015 per audio minute.
+    # Gemini 2.5 Flash Lite Preview for translation runs on the free tier
+    # (15 RPM, generous token limits), so requests cost nothing.
+    WHISPER_COST_PER_SECOND = 0.0015 / 60
+    TRANSLATION_COST_PER_REQUEST = 0.0
+
+    # Latency color coding: bisect the latency into LATENCY_BOUNDS (seconds) to
+    # pick a (color, emoji) tier; the history panel uses its own, coarser colors
+    LATENCY_BOUNDS = (0.5, 1, 2)
+    LATENCY_TIERS = (("bright_green", "🚀"), ("green", "⚡"), ("yellow", "✓"), ("red", "⚠"))
+    HISTORY_LATENCY_COLORS = ("bright_green", "green", "yellow", "yellow")
+
+    # Static pieces of the translation panel, shared by every render
+    _SEP = Text("─" * 60, style="dim")
+    _ORIGINAL_LABEL = Text("Original:", style="bold")
+    _TRANSLATION_LABEL = Text("Translation:", style="bold")
+
     THEMES = {
         'dark': {
             'bg': 'black',
@@ -90,6 +310,11 @@ class FireworksVoiceTranslator:
     }
 
     def __init__(self, target='zh', theme='dark'):
+        if pyaudio is None or webrtcvad is None:
+            raise RuntimeError(
+                "Audio support is not installed. Run: pip install 'voicetrans[audio]'"
+            )
+
         # Load config if exists
         self.config = self.load_config()
 
@@ -100,8 +325,12 @@ class FireworksVoiceTranslator:
         # Audio settings optimized for Fireworks
         self.sample_rate = 16000
         self.chunk_size = 480  # 30ms chunks for more stable detection
+        self.vad_batch_chunks = 3  # Chunks delivered per capture callback (90ms)
         self.is_recording = True
 
+        # 44-byte PCM WAV header (mono, 16-bit); only the two size fields change per utterance
+        self._wav_header_template = bytearray(_wav_header(self.sample_rate, 0))
+
         # VAD with balanced settings
         self.vad_level = 2  # Moderate aggressive VAD (1=least, 3=most)
         self.vad = webrtcvad.Vad(self.vad_level)
@@ -112,6 +341,7 @@ class FireworksVoiceTranslator:
         self.max_recording_duration = 5  # 5s max to avoid multiple sentences
         self.speech_timeout = 100  # 3s timeout for single utterance
         self.sensitivity_mode = self.config.get('sensitivity_mode', 'Balanced')
+        self._amp_thresh = self.AMPLITUDE_THRESHOLDS.get(self.sensitivity_mode, 0.008)
 
         # Fireworks-specific settings
         self.use_vad_optimization = self.config.get('use_vad_optimization', True)
@@ -119,25 +349,32 @@ class FireworksVoiceTranslator:
         
         # Queues
         self.audio_queue = queue.Queue()
+        self._audio_q = queue.SimpleQueue()  # Captured blocks from the PortAudio callback
         self.result_queue = queue.Queue()
 
         # State
         self.is_running = True
-        self.session_start = datetime.now()
+        self.session_start = datetime.now()  # Wall clock, for display/logging
+        self._session_start_mono = time.monotonic()  # Drives the session timer
 
         # Fireworks Client
         self.fireworks_client = None
+        self._http = None  # Shared keep-alive HTTP/2 connection pool
+        self._loop = None  # Background event loop that runs all API calls
+        self._keepalive = None  # Future of the idle-connection keepalive task
+        self._last_api_use = 0.0  # time.monotonic() of the last Fireworks request
         self.gemini_client = None  # Google Gemini for translation
         self.api_status = "Not initialized"
+        self.api_state = ApiState.IDLE
         self.is_processing = False
         
-        # Model selection
+        # Model selection; with turbo enabled, short utterances route to turbo
+        # and longer ones to full v3 (see _pick_model)
         self.whisper_model = "whisper-v3-turbo" if self.use_turbo_model else "whisper-v3"
+        self.turbo_max_duration = 3.0  # Seconds
         self.temperature = 0
         
-        # Thread pool for parallel processing
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        
+
         # Statistics
         self.stats = {
             'total_translations': 0,
@@ -152,24 +389,66 @@ class FireworksVoiceTranslator:
             'api_errors': 0,
             'total_audio_duration': 0,
             'fireworks_savings': 0,  # Time saved
-            'processing_speed': 0  # x realtime
+            'processing_speed': 0,  # x realtime
+            'model_latency': {}  # model -> [calls, total transcription seconds]
         }
+        self._stats_version = 0  # Bumped on every displayed stats write
+        self._stats_rendered_version = -1  # Version the stats panel cells show
 
         # History
-        self.history = deque(maxlen=100)
+        self.history = HistoryStore(capacity=100)
+
+        # Exact-match LRU caches: audio digest -> text, (text, target) -> translation
+        self.cache_size = 512
+        self._transcription_cache = OrderedDict()
+        self._translation_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.current_transcription = ""
         self.audio_level = 0
+        self.audio_peak = 0  # Normalized peak of the last chunk, for clipping
         self.is_speaking = False
 
         # UI State
         self.show_history = self.config.get('show_history', True)
         self.show_stats = self.config.get('show_stats', True)
-        self.ui_message = ""
-        self.ui_message_time = 0
+        self._ui_state = ("", 0.0)  # (message, shown_at), replaced in one store
         self.sensitivity_display_time = 0
+
+        # Incremental rendering: the layout is built once and only panels whose
+        # inputs changed are rebuilt; _dirty holds panel names marked by writers
+        self._layout = None
+        self._dirty = set()
+        self._nodes = {}  # Panel name -> its Layout node in self._layout
+        self._panel_builders = {
+            'status': self.create_status_panel,
+            'stats': self.create_stats_panel,
+            'controls': self.create_controls_panel,
+            'translation': self.create_translation_panel,
+            'history': self.create_history_panel,
+        }
+        self._panel_keys = {}  # Panel name -> state snapshot it was last built from
+        self._panel_built = {}  # Panel name -> time.monotonic() of its last rebuild
+        self.panel_refresh_interval = 0.5  # Polled panels rebuild at most 2x per second
+        self.meter_refresh_interval = 0.1  # Meter/clock-only redraws at most 10x per second
+        self._redraw_key = None
+        self._last_redraw = 0.0
+        self._audio_meter = _AudioMeter(self)
+        self._session_clock = _SessionClock(self._session_start_mono)
+        self._init_panels()
+        self._wake_w = None  # Write end of the UI loop's wake-up pipe, set while running
+        # Every possible meter, indexed [clipping][filled]; rendering never mutates a Text
+        self._meter_cache = [
+            [self._build_meter(filled, clipping) for filled in range(self.METER_WIDTH + 1)]
+            for clipping in (False, True)
+        ]
         
-        # Audio buffer
+        # Audio buffer: pre-allocated utterance storage (10s) written at _frame_pos
+        self._frame_buf = bytearray(self.sample_rate * 2 * 10)
+        self._frame_view = memoryview(self._frame_buf)
+        self._frame_pos = 0
         self.continuous_audio_buffer = []
+        # 1s of low-level noise for the 't' API test, generated once
+        self._test_pcm = np.random.default_rng(0).integers(-1000, 1000, 16000, dtype=np.int16).tobytes()
         self.recording_start_time = None
         
         # API keys
@@ -207,6 +486,11 @@ class FireworksVoiceTranslator:
         except Exception as e:
             print(f"Warning: Could not save config.json: {e}")
 
+    @property
+    def ui_message(self):
+        """Current status-line message (read-only view of _ui_state)"""
+        return self._ui_state[0]
+
     def initialize(self):
         """Initialize Fireworks AI and audio components"""
         try:
@@ -245,31 +529,42 @@ class FireworksVoiceTranslator:
                             self.console.print("[green]✓ API key saved to config.json[/]")
                     progress.start()
 
+                # Utterances are transcribed and translated as coroutines on a
+                # dedicated loop thread so back-to-back speech overlaps in flight
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="vt-api", daemon=True).start()
+
                 if self.fireworks_api_key:
                     try:
-                        # Initialize Fireworks client using OpenAI SDK
-                        self.fireworks_client = OpenAI(
-                            base_url="https://audio-prod.us-virginia-1.direct.fireworks.ai/v1",
-                            api_key=self.fireworks_api_key
+                        # Initialize Fireworks client using OpenAI SDK on a persistent
+                        # HTTP/2 pool so utterances skip the TCP+TLS handshake
+                        self._http = httpx.AsyncClient(
+                            http2=True,
+                            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+                            timeout=httpx.Timeout(10.0, connect=2.0)
+                        )
+                        self.fireworks_client = AsyncOpenAI(
+                            base_url=_FIREWORKS_BASE_URL,
+                            api_key=self.fireworks_api_key,
+                            http_client=self._http
                         )
                         
                         # Test the API with a small audio sample
-                        test_audio = self._create_test_audio()
-                        test_audio_bytes = test_audio.read()
-                        
                         progress.update(task, description="[cyan]Testing Fireworks connection...")
                         
-                        test_response = self.fireworks_client.audio.transcriptions.create(
+                        test_response = self._run(self.fireworks_client.audio.transcriptions.create(
                             model="whisper-v3",  # Use standard model name for test
-                            file=("test.wav", test_audio_bytes, "audio/wav"),
+                            file=("test.wav", _SILENT_TEST_WAV, "audio/wav"),
                             response_format="text"
-                        )
+                        ))
                         
                         self.api_status = "API Connected"
+                        self.api_state = ApiState.OK
                         progress.update(task, description="[green]✓ Transcription service connected")
-                        
-                        # Successfully connected - use standard model name
-                        self.whisper_model = "whisper-v3"
+
+                        # The test request left a warm TLS connection in the pool; keep it alive
+                        self._last_api_use = time.monotonic()
+                        self._keepalive = asyncio.run_coroutine_threadsafe(self._keep_connection_warm(), self._loop)
                         
                     except Exception as e:
                         error_str = str(e)
@@ -281,6 +576,7 @@ class FireworksVoiceTranslator:
                             progress.update(task, description="[red]✗ API endpoint not found")
                         else:
                             self.api_status = f"Error: {error_str[:30]}"
+                            self.api_state = ApiState.ERR
                             progress.update(task, description=f"[red]✗ API error: {error_str[:50]}")
                         self.fireworks_client = None
                         
@@ -333,8 +629,11 @@ class FireworksVoiceTranslator:
                     channels=1,
                     rate=self.sample_rate,
                     input=True,
-                    frames_per_buffer=self.chunk_size
+                    frames_per_buffer=self.chunk_size * self.vad_batch_chunks,
+                    stream_callback=self._audio_callback
                 )
+                # Compile the level kernel now so the first real chunk doesn't pay for it
+                _audio_stats(np.zeros(self.chunk_size, dtype=np.int16), 0, self.chunk_size)
                 progress.update(task, description="[green]✓ Audio system ready")
                 
                 # Show optimization status
@@ -347,188 +646,282 @@ class FireworksVoiceTranslator:
                 if self.use_vad_optimization:
                     self.console.print("  • VAD optimization enabled")
 
+            # Build the UI skeleton once; later ticks only swap changed panels into it
+            self._build_layout()
+
             return True
 
         except Exception as e:
             self.console.print(f"[red]✗ Initialization failed: {e}")
             return False
 
-    def _create_test_audio(self):
-        """Create a silent test audio for API validation"""
-        # Create 0.5 second of silence
-        duration = 0.5
-        samples = np.zeros(int(self.sample_rate * duration), dtype=np.int16)
-        
-        # Create WAV file in memory
-        buffer = io.BytesIO()
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(samples.tobytes())
-        
-        buffer.seek(0)
-        return buffer
+    def _run(self, coro, timeout=None):
+        """Run a coroutine on the API loop and block until it finishes"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def close(self):
+        """Release the pooled HTTP connections and stop the API loop"""
+        if self._loop is None:
+            return
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+            self._keepalive = None
+        if self._http is not None:
+            try:
+                self._run(self._http.aclose(), timeout=1)
+            except Exception:
+                pass
+            self._http = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+
+    async def _keep_connection_warm(self):
+        """Touch the Fireworks endpoint whenever the pool has sat idle for a while"""
+        while True:
+            await asyncio.sleep(_KEEPALIVE_INTERVAL)
+            if time.monotonic() - self._last_api_use < _KEEPALIVE_INTERVAL:
+                continue
+            try:
+                # Any response will do; the point is traffic on the pooled connection
+                await self._http.head(_FIREWORKS_BASE_URL, timeout=5.0)
+            except Exception:
+                pass
+            self._last_api_use = time.monotonic()
+
+    def _to_wav(self, audio_data):
+        """Prefix raw 16-bit PCM (bytes or memoryview) with a copy of the precomputed WAV header"""
+        header = bytearray(self._wav_header_template)
+        struct.pack_into('<I', header, 4, 36 + len(audio_data))
+        struct.pack_into('<I', header, 40, len(audio_data))
+        return b''.join((header, audio_data))
+
+    def _append_frame(self, data):
+        """Copy a captured chunk into the utterance buffer, growing it if needed"""
+        end = self._frame_pos + len(data)
+        if end > len(self._frame_buf):
+            # Pauses inside an utterance can outlast the initial capacity
+            self._frame_view.release()
+            self._frame_buf.extend(bytes(len(self._frame_buf)))
+            self._frame_view = memoryview(self._frame_buf)
+        self._frame_view[self._frame_pos:end] = data
+        self._frame_pos = end
+
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio capture callback: hand blocks to the processing thread"""
+        if status & pyaudio.paInputOverflow:
+            self._ui_state = ("Audio input overflow - samples dropped", time.time())
+        if self.is_recording:
+            self._audio_q.put(in_data)
+        return (None, pyaudio.paContinue)
 
     def process_audio(self):
         """Audio processing thread optimized for Fireworks low-latency"""
-        frames = []
+        self._frame_pos = 0
+        frame_count = 0
         silent_chunks = 0
         speech_chunks = 0
         recording_chunks = 0
-        
+
+        # Hoist hot attributes and globals out of the capture loop. The
+        # segmentation thresholds stay attribute reads since adjust_sensitivity()
+        # may change them mid-stream; set_mode() mutates the same VAD object,
+        # so the bound is_speech keeps tracking it.
+        vad_is_speech = self.vad.is_speech
+        next_block = self._audio_q.get
+        sample_rate = self.sample_rate
+        chunk_size = self.chunk_size
+        chunk_bytes = chunk_size * 2
+        frombuffer = np.frombuffer
+        int16 = np.int16
+        audio_stats = _audio_stats
+        append_frame = self._append_frame
+        to_wav = self._to_wav
+        submit = asyncio.run_coroutine_threadsafe
+        transcribe = self._transcribe_async
+        loop = self._loop
+        now = time.time
+        Empty = queue.Empty
+
         while self.is_running:
             try:
-                if self.is_recording:
-                    # Read audio
-                    data = self.stream.read(self.chunk_size, exception_on_overflow=False)
+                # Wait for the capture callback's next micro-batch, then run VAD on each chunk
+                try:
+                    block = next_block(timeout=0.1)
+                except Empty:
+                    continue
+                # One int16 view per block; the kernel indexes each chunk within it
+                samples = frombuffer(block, dtype=int16)
+                for offset in range(0, len(block), chunk_bytes):
+                    data = block[offset:offset + chunk_bytes]
 
                     # Calculate audio level for visualization
-                    audio_array = np.frombuffer(data, dtype=np.int16)
-                    self.audio_level = np.abs(audio_array).mean() / 32768.0
-
-                    # VAD check with dynamic threshold
-                    is_speech = self.vad.is_speech(data, self.sample_rate)
-
-                    # Dynamic amplitude threshold based on mode
-                    amplitude_threshold = {
-                        "Hyper-Speed": 0.003,
-                        "Ultra-Fast": 0.005,
-                        "Balanced": 0.008,
-                        "Accurate": 0.01
-                    }.get(self.sensitivity_mode, 0.008)
-
-                    is_loud_enough = self.audio_level > amplitude_threshold
+                    first = offset >> 1
+                    self.audio_level, self.audio_peak = audio_stats(samples, first, first + chunk_size)
 
-                    # Combine VAD and amplitude
-                    is_speech = is_speech and is_loud_enough
+                    # Combine amplitude and VAD; the cheap amplitude gate runs first
+                    # so quiet chunks never reach the VAD call
+                    is_speech = self.audio_level > self._amp_thresh and vad_is_speech(data, sample_rate)
                     self.is_speaking = is_speech
 
                     if is_speech:
-                        if not frames:  # Start of new speech
-                            self.recording_start_time = time.time()
-                            
-                        frames.append(data)
+                        if not frame_count:  # Start of new speech
+                            self.recording_start_time = now()
+                        
+                        append_frame(data)
+                        frame_count += 1
                         silent_chunks = 0
                         speech_chunks += 1
                         recording_chunks += 1
 
                         # Check for max duration or speech timeout
-                        if (recording_chunks * self.chunk_size / self.sample_rate > self.max_recording_duration or
+                        if (recording_chunks * chunk_size / sample_rate > self.max_recording_duration or
                             speech_chunks >= self.speech_timeout):
-                            if len(frames) > self.min_speech_chunks:
-                                audio_data = b''.join(frames)
+                            if frame_count > self.min_speech_chunks:
+                                # Header + PCM in a single copy out of the shared buffer
+                                wav_bytes = to_wav(self._frame_view[:self._frame_pos])
                                 # Process immediately with Fireworks
-                                threading.Thread(
-                                    target=self.transcribe_with_fireworks, 
-                                    args=(audio_data,), 
-                                    daemon=True
-                                ).start()
-                            frames = []
+                                submit(transcribe(wav_bytes), loop)
+                            self._frame_pos = frame_count = 0
                             recording_chunks = 0
                             speech_chunks = 0
 
-                    elif frames:
+                    elif frame_count:
                         silent_chunks += 1
-                        frames.append(data)
+                        append_frame(data)
+                        frame_count += 1
 
                         # Improved end detection with natural pause threshold
                         if silent_chunks > self.silence_threshold:
-                            if len(frames) > self.min_speech_chunks:
-                                duration = len(frames) * self.chunk_size / self.sample_rate
+                            if frame_count > self.min_speech_chunks:
+                                duration = frame_count * chunk_size / sample_rate
                                 # Ensure minimum duration for meaningful speech (skip short noises)
                                 if duration < 0.5:
-                                    frames = []
+                                    self._frame_pos = frame_count = 0
                                     silent_chunks = 0
                                     speech_chunks = 0
                                     recording_chunks = 0
                                     self.is_speaking = False
                                     continue
                                 self.stats['total_audio_duration'] += duration
-                                
-                                audio_data = b''.join(frames)
+                                self._stats_version += 1
+                            
+                                # Header + PCM in a single copy out of the shared buffer
+                                wav_bytes = to_wav(self._frame_view[:self._frame_pos])
                                 # Process immediately with Fireworks
-                                threading.Thread(
-                                    target=self.transcribe_with_fireworks, 
-                                    args=(audio_data,), 
-                                    daemon=True
-                                ).start()
+                                submit(transcribe(wav_bytes), loop)
 
-                            frames = []
+                            self._frame_pos = frame_count = 0
                             silent_chunks = 0
                             speech_chunks = 0
                             recording_chunks = 0
                             self.is_speaking = False
-                else:
-                    time.sleep(0.1)
 
             except Exception as e:
-                self.ui_message = f"Audio error: {str(e)}"
-                self.ui_message_time = time.time()
+                self._ui_state = (f"Audio error: {str(e)}", time.time())
                 self.stats['api_errors'] += 1
+                self._stats_version += 1
                 time.sleep(0.1)
 
     def transcribe_with_fireworks(self, audio_data):
-        """Transcribe audio for ultra-low latency"""
+        """Transcribe and translate one utterance, blocking until it is done"""
+        if self._loop is None:
+            self._ui_state = ("API not configured", time.time())
+            return
+        self._run(self._transcribe_async(self._to_wav(audio_data)))
+
+    def submit_test_transcription(self, audio_data):
+        """Send a test utterance in the background; the outcome lands on the status line"""
+        if self._loop is None:
+            self._ui_state = ("API not configured", time.time())
+            return None
+        self._ui_state = ("Testing API directly...", time.time())
+        # Uncached: the test buffer is identical on every press and must still reach Fireworks
+        future = asyncio.run_coroutine_threadsafe(
+            self._transcribe_async(self._to_wav(audio_data), use_cache=False), self._loop
+        )
+        future.add_done_callback(self._on_test_done)
+        return future
+
+    def _on_test_done(self, future):
+        """Report a test request that failed outside the transcription error handling"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._ui_state = (f"Test: {str(error)[:40]}", time.time())
+
+    def _pick_model(self, audio_duration):
+        """Whisper model for an utterance: turbo for short clips, full v3 for accuracy on long ones"""
+        if self.use_turbo_model and audio_duration < self.turbo_max_duration:
+            return "whisper-v3-turbo"
+        return "whisper-v3"
+
+    async def _transcribe_async(self, wav_bytes, use_cache=True):
+        """Transcribe a complete WAV utterance for ultra-low latency
+
+        use_cache=False always calls Fireworks and leaves the transcription cache untouched.
+        """
         try:
             start_time = time.time()
             self.is_processing = True
 
             if not self.fireworks_client:
-                self.ui_message = "API not configured"
-                self.ui_message_time = time.time()
+                self._ui_state = ("API not configured", time.time())
                 self.is_processing = False
                 return
 
-            # Create WAV file in memory - properly formatted
-            audio_buffer = io.BytesIO()
-            with wave.open(audio_buffer, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data)
-            
-            # Get the complete WAV file bytes
-            wav_bytes = audio_buffer.getvalue()
+            # The upload is sent as-is; the PCM payload is only viewed, not copied
+            audio_data = memoryview(wav_bytes)[len(self._wav_header_template):]
             audio_duration = len(audio_data) / (self.sample_rate * 2)
             
             # Debug message
-            self.ui_message = f"Processing {audio_duration:.1f}s audio..."
-            self.ui_message_time = time.time()
+            self._ui_state = (f"Processing {audio_duration:.1f}s audio...", time.time())
 
             try:
-                # Call Fireworks API exactly like the test script
-                transcription = self.fireworks_client.audio.transcriptions.create(
-                    model="whisper-v3",
-                    file=("audio.wav", wav_bytes, "audio/wav")
-                )
-                
-                # Get transcribed text - handle the response format
-                if hasattr(transcription, 'text'):
-                    text = transcription.text.strip()
-                else:
-                    text = str(transcription).strip()
-                
-                if not text or text == "":
-                    self.ui_message = "No speech detected"
-                    self.ui_message_time = time.time()
-                    self.is_processing = False
-                    return
-                
-                self.stats['api_calls'] += 1
+                # Repeated utterances are answered from the cache
+                text = None
+                if use_cache:
+                    audio_key = hashlib.blake2b(audio_data, digest_size=8).digest()
+                    text = self._cache_get(self._transcription_cache, audio_key)
+
+                if text is None:
+                    # Call Fireworks API exactly like the test script
+                    model = self._pick_model(audio_duration)
+                    self.whisper_model = model
+                    self._last_api_use = api_start = time.monotonic()
+                    transcription = await self.fireworks_client.audio.transcriptions.create(
+                        model=model,
+                        file=("audio.wav", wav_bytes, "audio/wav"),
+                        response_format="text",
+                        temperature=self.temperature
+                    )
+
+                    # Per-model latency, so routing can later be tuned from real numbers
+                    model_stats = self.stats['model_latency'].setdefault(model, [0, 0.0])
+                    model_stats[0] += 1
+                    model_stats[1] += time.monotonic() - api_start
+
+                    # Plain-text responses come back as str, no JSON envelope to unwrap
+                    text = transcription.strip() if isinstance(transcription, str) else str(transcription).strip()
+
+                    if not text or text == "":
+                        self._ui_state = ("No speech detected", time.time())
+                        self.is_processing = False
+                        return
+
+                    self.stats['api_calls'] += 1
+                    self._stats_version += 1
+                    if use_cache:
+                        self._cache_put(self._transcription_cache, audio_key, text)
                 
                 # Debug: Show successful transcription
-                self.ui_message = f"Transcribed: {text[:30]}..."
-                self.ui_message_time = time.time()
+                self._ui_state = (f"Transcribed: {text[:30]}...", time.time())
                 
                 # Translation
                 translated = text
                 if self.gemini_client:
                     try:
-                        translation_future = self.executor.submit(
-                            self._translate_text, text
-                        )
-                        translated = translation_future.result(timeout=3)
+                        translated = await asyncio.wait_for(self._translate_text(text), timeout=3)
                     except:
                         translated = text
                     
@@ -536,15 +929,16 @@ class FireworksVoiceTranslator:
                 # More detailed error message
                 error_msg = str(e)
                 if "401" in error_msg or "unauthorized" in error_msg:
-                    self.ui_message = "Invalid API key"
+                    message = "Invalid API key"
                 elif "429" in error_msg:
-                    self.ui_message = "Rate limit hit"
+                    message = "Rate limit hit"
                 elif "400" in error_msg:
-                    self.ui_message = "Bad request format"
+                    message = "Bad request format"
                 else:
-                    self.ui_message = f"API: {error_msg[:40]}"
-                self.ui_message_time = time.time()
+                    message = f"API: {error_msg[:40]}"
+                self._ui_state = (message, time.time())
                 self.stats['api_errors'] += 1
+                self._stats_version += 1
                 self.is_processing = False
                 
                 # Print full error for debugging
@@ -570,56 +964,79 @@ class FireworksVoiceTranslator:
             baseline_latency = 3.0
             time_saved = max(0, baseline_latency - latency)
             self.stats['fireworks_savings'] += time_saved
+            self._stats_version += 1
 
             # Add to history
-            entry = {
-                'timestamp': datetime.now(),
-                'original': text,
-                'translated': translated,
-                'target_lang': self.target_lang,
-                'latency': latency,
-                'words': len(text.split()),
-                'api_model': self.whisper_model,
-                'speed': f"{processing_speed:.1f}x"
-            }
-            self.history.append(entry)
+            self.history.append(
+                timestamp=datetime.now(),
+                original=text,
+                translated=translated,
+                target_lang=self.target_lang,
+                latency=latency,
+                words=len(text.split()),
+                api_model=self.whisper_model,
+                speed=f"{processing_speed:.1f}x"
+            )
+            self._mark_dirty('translation', 'history')
 
             # Show ultra-fast response
             if latency < 0.5:
-                self.ui_message = f"⚡ Ultra-fast: {latency:.2f}s ({processing_speed:.0f}x realtime)"
-                self.ui_message_time = time.time()
+                self._ui_state = (f"⚡ Ultra-fast: {latency:.2f}s ({processing_speed:.0f}x realtime)", time.time())
 
             self.is_processing = False
 
         except Exception as e:
-            self.ui_message = f"Processing error: {str(e)}"
-            self.ui_message_time = time.time()
+            self._ui_state = (f"Processing error: {str(e)}", time.time())
             self.stats['api_errors'] += 1
+            self._stats_version += 1
             self.is_processing = False
 
-    def _translate_text(self, text):
+    def _cache_get(self, cache, key):
+        """Look up a cached response, marking it as recently used"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache, key, value):
+        """Store a response, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    async def _translate_text(self, text):
         """Translate text using Google Gemini"""
         if not self.gemini_client:
             return text
 
+        cache_key = (text, self.target_lang)
+        cached = self._cache_get(self._translation_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Create the translation prompt
-            prompt = f"Translate the following text to {self.LANGUAGES[self.target_lang][0]}. Output only the translation, nothing else:\n\n{text}"
+            # Target language goes in the user turn so the system prefix stays cacheable
+            prompt = f"Target language: {self.LANGUAGES[self.target_lang][0]}\n\n{text}"
 
             # Use Gemini 2.5 Flash Lite Preview for fast translation
-            response = self.gemini_client.models.generate_content(
+            response = await self.gemini_client.aio.models.generate_content(
                 model="gemini-2.5-flash-lite-preview-09-2025",
-                contents=prompt
+                contents=prompt,
+                config={'system_instruction': _TRANSLATE_SYSTEM}
             )
 
             # Extract the translated text
             if response and response.text:
-                return response.text.strip()
+                translated = response.text.strip()
+                self._cache_put(self._translation_cache, cache_key, translated)
+                return translated
             return text
         except Exception as e:
             # Log error for debugging
-            self.ui_message = f"Translation error: {str(e)[:30]}"
-            self.ui_message_time = time.time()
+            self._ui_state = (f"Translation error: {str(e)[:30]}", time.time())
             return text
 
     def save_to_file(self):
@@ -636,7 +1053,7 @@ class FireworksVoiceTranslator:
 
                 if self.history:
                     for entry in self.history:
-                        f.write(f"[{entry['timestamp'].strftime('%H:%M:%S')}]\n")
+                        f.write(f"[{entry['time_str']}]\n")
                         f.write(f"Original: {entry['original']}\n")
                         f.write(f"Translation ({self.LANGUAGES[entry['target_lang']][0]}): {entry['translated']}\n")
                         f.write(f"Latency: {entry['latency']:.3f}s | Words: {entry['words']} | Speed: {entry['speed']}\n")
@@ -656,12 +1073,10 @@ class FireworksVoiceTranslator:
                 else:
                     f.write("No translations recorded in this session.\n")
 
-            self.ui_message = f"✓ Saved to {filename}"
-            self.ui_message_time = time.time()
+            self._ui_state = (f"✓ Saved to {filename}", time.time())
 
         except Exception as e:
-            self.ui_message = f"Save failed: {str(e)[:30]}"
-            self.ui_message_time = time.time()
+            self._ui_state = (f"Save failed: {str(e)[:30]}", time.time())
 
     def adjust_sensitivity(self, direction):
         """Adjust detection sensitivity"""
@@ -674,7 +1089,7 @@ class FireworksVoiceTranslator:
             self.sensitivity_mode = "Hyper-Speed"
             self.vad_level = 1
             self.vad.set_mode(self.vad_level)
-            self.ui_message = "🚀 Hyper-Speed Mode - Minimum latency"
+            message = "🚀 Hyper-Speed Mode - Minimum latency"
         elif direction == '-':
             # More accurate - longer pauses for complete sentences
             self.silence_threshold = 35  # 1050ms pause
@@ -684,7 +1099,7 @@ class FireworksVoiceTranslator:
             self.sensitivity_mode = "Accurate"
             self.vad_level = 3
             self.vad.set_mode(self.vad_level)
-            self.ui_message = "🎯 Accurate Mode - Better accuracy"
+            message = "🎯 Accurate Mode - Better accuracy"
         elif direction == '=':
             # Ultra-fast - balanced speed
             self.silence_threshold = 20  # 600ms pause
@@ -694,7 +1109,7 @@ class FireworksVoiceTranslator:
             self.sensitivity_mode = "Ultra-Fast"
             self.vad_level = 2
             self.vad.set_mode(self.vad_level)
-            self.ui_message = "⚡ Ultra-Fast Mode - Optimized performance"
+            message = "⚡ Ultra-Fast Mode - Optimized performance"
         elif direction == '0':
             # Balanced mode - natural conversation
             self.silence_threshold = 25  # 750ms pause
@@ -704,9 +1119,65 @@ class FireworksVoiceTranslator:
             self.sensitivity_mode = "Balanced"
             self.vad_level = 2
             self.vad.set_mode(self.vad_level)
-            self.ui_message = "⚖️ Balanced Mode - Reliable detection"
+            message = "⚖️ Balanced Mode - Reliable detection"
 
-        self.ui_message_time = time.time()
+        self._amp_thresh = self.AMPLITUDE_THRESHOLDS.get(self.sensitivity_mode, 0.008)
+        self._ui_state = (message, time.time())
+
+    def _init_panels(self):
+        """Build the status, stats and history panels once; refreshes only swap cell values"""
+        # Status
+        self._status_cells = {name: _Cell() for name in ('lang', 'rec', 'api', 'model', 'sens')}
+        status_table = Table(show_header=False, box=None, padding=0)
+        status_table.add_column(justify="center")
+        status_table.add_row(self._status_cells['lang'])
+        status_table.add_row("")
+        for name in ('rec', 'api', 'model', 'sens'):
+            status_table.add_row(self._status_cells[name])
+        status_table.add_row(self._audio_meter)
+        self._status_panel = Panel(
+            status_table,
+            title="[bold]Status",
+            border_style=self.theme['secondary'],
+            box=box.ROUNDED
+        )
+
+        # Stats
+        self._stats_cells = [(_Cell(), _Cell()) for _ in range(self.STATS_ROWS)]
+        stats_table = Table(show_header=False, box=None, padding=0)
+        stats_table.add_column(style=f"{self.theme['secondary']}", width=20)
+        stats_table.add_column(style="white")
+        for label_cell, value_cell in self._stats_cells:
+            stats_table.add_row(label_cell, value_cell)
+        self._stats_panel = Panel(
+            stats_table,
+            title="[bold]Performance",
+            border_style=self.theme['secondary'],
+            box=box.ROUNDED
+        )
+        self._stats_hidden_panel = Panel(
+            Align.center(Text("Stats Hidden", style="dim")),
+            title="[bold]Statistics",
+            border_style="dim",
+            box=box.ROUNDED
+        )
+
+        # History
+        self._history_cells = [tuple(_Cell() for _ in range(5)) for _ in range(self.HISTORY_ROWS)]
+        history_table = Table(show_header=True, box=box.SIMPLE, padding=0)
+        history_table.add_column("Time", style="dim", width=8)
+        history_table.add_column("Text", style="white", ratio=1)
+        history_table.add_column("→", style="dim", width=1)
+        history_table.add_column("Translation", style=self.theme['accent'], ratio=1)
+        history_table.add_column("⚡", style="dim", width=6)
+        for cells in self._history_cells:
+            history_table.add_row(*cells)
+        self._history_panel = Panel(
+            history_table,
+            title="[bold]Recent History (0 total)",
+            border_style=self.theme['secondary'],
+            box=box.ROUNDED
+        )
 
     def create_header(self):
         """Create header panel"""
@@ -745,9 +1216,9 @@ class FireworksVoiceTranslator:
             rec_status = Text("⏸ PAUSED", style="bold yellow")
 
         # API status
-        if "Connected" in self.api_status:
+        if self.api_state == ApiState.OK:
             api_status = Text(f"✓ API Connected", style="bold green")
-        elif "Error" in self.api_status:
+        elif self.api_state == ApiState.ERR:
             api_status = Text(f"✗ API Error", style="bold red")
         else:
             api_status = Text(f"○ {self.api_status}", style="bold yellow")
@@ -763,33 +1234,18 @@ class FireworksVoiceTranslator:
         else:
             sens_indicator = Text(f"🎯 {self.sensitivity_mode}", style="bold green")
 
-        # Audio level meter
-        level_bar = self.create_audio_meter()
-
-        # Combine status elements
-        status_table = Table(show_header=False, box=None, padding=0)
-        status_table.add_column(justify="center")
-        status_table.add_row(lang_text)
-        status_table.add_row("")
-        status_table.add_row(rec_status)
-        status_table.add_row(api_status)
-        status_table.add_row(model_text)
-        status_table.add_row(sens_indicator)
-        status_table.add_row(level_bar)
-
-        return Panel(
-            status_table,
-            title="[bold]Status",
-            border_style=self.theme['secondary'],
-            box=box.ROUNDED
-        )
-
-    def create_audio_meter(self):
-        """Create audio level meter"""
-        meter_width = 25
-        filled = int(self.audio_level * meter_width * 10)
-        filled = min(filled, meter_width)
-
+        # Refresh the persistent panel's cells; the meter cell redraws itself
+        cells = self._status_cells
+        cells['lang'].value = lang_text
+        cells['rec'].value = rec_status
+        cells['api'].value = api_status
+        cells['model'].value = model_text
+        cells['sens'].value = sens_indicator
+        return self._status_panel
+
+    def _build_meter(self, filled, clipping):
+        """Render the level bar for a given fill; used once per entry to build the meter table"""
+        meter_width = self.METER_WIDTH
         meter = Text()
         meter.append("│", style="dim")
 
@@ -806,8 +1262,16 @@ class FireworksVoiceTranslator:
 
         meter.append("│", style="dim")
 
+        if clipping:
+            meter.append(" CLIP", style="bold red")
+
         return meter
 
+    def create_audio_meter(self):
+        """Create audio level meter"""
+        filled = min(int(self.audio_level * self.METER_WIDTH * 10), self.METER_WIDTH)
+        return self._meter_cache[self.audio_peak >= 0.99][filled]
+
     def create_translation_panel(self):
         """Create translation display panel"""
         if self.history:
@@ -816,38 +1280,27 @@ class FireworksVoiceTranslator:
             content.add_column(overflow="fold")
 
             # Show last 3 messages
-            recent_messages = list(self.history)[-3:]
+            recent_messages = self.history.latest(3)
 
             for i, entry in enumerate(recent_messages):
                 # Add separator between messages (except for the first one)
                 if i > 0:
-                    content.add_row("", Text("─" * 60, style="dim"))
+                    content.add_row("", self._SEP)
                     content.add_row("", "")
 
                 # Original text
-                content.add_row("[bold]Original:[/]", Text(entry['original'], style="white"))
+                content.add_row(self._ORIGINAL_LABEL, Text(entry['original'], style="white"))
                 content.add_row("", "")
 
                 # Translated text
-                content.add_row("[bold]Translation:[/]", Text(entry['translated'], style=self.theme['accent']))
+                content.add_row(self._TRANSLATION_LABEL, Text(entry['translated'], style=self.theme['accent']))
                 content.add_row("", "")
 
                 # Metadata with speed info
-                time_str = entry['timestamp'].strftime('%H:%M:%S')
+                time_str = entry['time_str']
 
                 # Ultra-fast latency color coding
-                if entry['latency'] < 0.5:
-                    latency_color = "bright_green"
-                    speed_emoji = "🚀"
-                elif entry['latency'] < 1:
-                    latency_color = "green"
-                    speed_emoji = "⚡"
-                elif entry['latency'] < 2:
-                    latency_color = "yellow"
-                    speed_emoji = "✓"
-                else:
-                    latency_color = "red"
-                    speed_emoji = "⚠"
+                latency_color, speed_emoji = self.LATENCY_TIERS[bisect_right(self.LATENCY_BOUNDS, entry['latency'])]
 
                 meta_text = Text()
                 meta_text.append(f"{time_str} • ", style="dim")
@@ -872,111 +1325,84 @@ class FireworksVoiceTranslator:
 
     def create_history_panel(self):
         """Create history panel"""
-        history_table = Table(show_header=True, box=box.SIMPLE, padding=0)
-        history_table.add_column("Time", style="dim", width=8)
-        history_table.add_column("Text", style="white", ratio=1)
-        history_table.add_column("→", style="dim", width=1)
-        history_table.add_column("Translation", style=self.theme['accent'], ratio=1)
-        history_table.add_column("⚡", style="dim", width=6)
+        entries = self.history.latest(self.HISTORY_ROWS)
 
-        # Show last 5 entries
-        for entry in list(self.history)[-5:]:
-            time_str = entry['timestamp'].strftime('%H:%M:%S')
-            orig = entry['original'][:25] + "..." if len(entry['original']) > 25 else entry['original']
-            trans = entry['translated'][:25] + "..." if len(entry['translated']) > 25 else entry['translated']
+        # Show last 5 entries; unused rows are blanked
+        for i, (time_cell, orig_cell, arrow_cell, trans_cell, latency_cell) in enumerate(self._history_cells):
+            if i >= len(entries):
+                time_cell.value = orig_cell.value = arrow_cell.value = trans_cell.value = latency_cell.value = ""
+                continue
+            entry = entries[i]
 
             # Ultra-fast color coding
-            if entry['latency'] < 0.5:
-                latency_text = Text(f"{entry['latency']:.2f}s", style="bright_green")
-            elif entry['latency'] < 1:
-                latency_text = Text(f"{entry['latency']:.2f}s", style="green")
-            else:
-                latency_text = Text(f"{entry['latency']:.2f}s", style="yellow")
-
-            history_table.add_row(
-                time_str,
-                orig,
-                "→",
-                trans,
-                latency_text
-            )
+            latency_color = self.HISTORY_LATENCY_COLORS[bisect_right(self.LATENCY_BOUNDS, entry['latency'])]
+            time_cell.value = entry['time_str']
+            orig_cell.value = entry['orig_short']
+            arrow_cell.value = "→"
+            trans_cell.value = entry['trans_short']
+            latency_cell.value = Text(f"{entry['latency']:.2f}s", style=latency_color)
 
-        return Panel(
-            history_table,
-            title=f"[bold]Recent History ({len(self.history)} total)",
-            border_style=self.theme['secondary'],
-            box=box.ROUNDED
-        )
+        self._history_panel.title = f"[bold]Recent History ({len(self.history)} total)"
+        return self._history_panel
 
     def create_stats_panel(self):
         """Create statistics panel with Fireworks metrics"""
         if not self.show_stats:
-            return Panel(
-                Align.center(Text("Stats Hidden", style="dim")),
-                title="[bold]Statistics",
-                border_style="dim",
-                box=box.ROUNDED
-            )
-
-        # Calculate session duration
-        duration = (datetime.now() - self.session_start).total_seconds()
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
-
-        stats_table = Table(show_header=False, box=None, padding=0)
-        stats_table.add_column(style=f"{self.theme['secondary']}", width=20)
-        stats_table.add_column(style="white")
-
-        stats_table.add_row("Session Time:", f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-        stats_table.add_row("Translations:", str(self.stats['total_translations']))
-        stats_table.add_row("Total Words:", str(self.stats['total_words']))
-        stats_table.add_row("API Calls:", str(self.stats['api_calls']))
+            return self._stats_hidden_panel
+
+        # Cells already show this version of the stats
+        version = self._stats_version
+        if version == self._stats_rendered_version:
+            return self._stats_panel
+        self._stats_rendered_version = version
+
+        # Session time is a live cell that formats itself on every redraw
+        rows = []
+        rows.append(("Session Time:", self._session_clock))
+        rows.append(("Translations:", str(self.stats['total_translations'])))
+        rows.append(("Total Words:", str(self.stats['total_words'])))
+        rows.append(("API Calls:", str(self.stats['api_calls'])))
         
         if self.stats['api_errors'] > 0:
-            stats_table.add_row("API Errors:", Text(str(self.stats['api_errors']), style="red"))
+            rows.append(("API Errors:", Text(str(self.stats['api_errors']), style="red")))
 
         if self.stats['total_translations'] > 0:
             # Latency metrics
             avg_color = "bright_green" if self.stats['avg_latency'] < 0.5 else "green" if self.stats['avg_latency'] < 1 else "yellow"
-            stats_table.add_row("Avg Latency:", 
-                              Text(f"{self.stats['avg_latency']:.3f}s", style=avg_color))
-            stats_table.add_row("Best/Worst:", 
-                              f"{self.stats['min_latency']:.3f}s / {self.stats['peak_latency']:.3f}s")
+            rows.append(("Avg Latency:", 
+                       Text(f"{self.stats['avg_latency']:.3f}s", style=avg_color)))
+            rows.append(("Best/Worst:", 
+                       f"{self.stats['min_latency']:.3f}s / {self.stats['peak_latency']:.3f}s"))
             
             # Processing speed
             if self.stats['processing_speed'] > 0:
-                stats_table.add_row("Speed:", 
-                                  Text(f"{self.stats['processing_speed']:.0f}x realtime", style="cyan"))
+                rows.append(("Speed:", 
+                           Text(f"{self.stats['processing_speed']:.0f}x realtime", style="cyan")))
             
             # Time saved
             time_saved_min = self.stats['fireworks_savings'] / 60
-            stats_table.add_row("Time Saved:",
-                              Text(f"{time_saved_min:.1f} min", style="green"))
+            rows.append(("Time Saved:",
+                       Text(f"{time_saved_min:.1f} min", style="green")))
 
             # Cost calculations with new pricing
-            # Whisper-v3-large: $0.0015 per audio minute
-            whisper_cost = (self.stats['total_audio_duration'] / 60) * 0.0015
-
-            # Gemini 2.5 Flash Lite Preview for translation (free tier up to certain limits)
-            # Gemini is much more cost-effective than GPT models
-            # Free tier: 15 RPM, generous token limits
-            translation_cost = 0.0  # Using free tier
+            whisper_cost, translation_cost, total_cost = self.session_costs()
 
-            total_cost = whisper_cost + translation_cost
-
-            stats_table.add_row("Whisper Cost:", f"${whisper_cost:.5f}")
+            rows.append(("Whisper Cost:", f"${whisper_cost:.5f}"))
             if self.stats['total_translations'] > 0:
-                stats_table.add_row("Translation:", f"${translation_cost:.5f}")
-            stats_table.add_row("Total Cost:",
-                              Text(f"${total_cost:.5f}", style="green"))
+                rows.append(("Translation:", f"${translation_cost:.5f}"))
+            rows.append(("Total Cost:",
+                       Text(f"${total_cost:.5f}", style="green")))
 
-        return Panel(
-            stats_table,
-            title="[bold]Performance",
-            border_style=self.theme['secondary'],
-            box=box.ROUNDED
-        )
+        # Fill the persistent table top-down and blank whatever is left
+        for i, (label_cell, value_cell) in enumerate(self._stats_cells):
+            label_cell.value, value_cell.value = rows[i] if i < len(rows) else ("", "")
+        return self._stats_panel
+
+    def session_costs(self):
+        """(whisper, translation, total) cost of the session so far, in USD"""
+        whisper_cost = self.stats['total_audio_duration'] * self.WHISPER_COST_PER_SECOND
+        translation_cost = self.stats['total_translations'] * self.TRANSLATION_COST_PER_REQUEST
+        return whisper_cost, translation_cost, whisper_cost + translation_cost
 
     def create_controls_panel(self):
         """Create controls panel"""
@@ -1015,8 +1441,9 @@ class FireworksVoiceTranslator:
         controls.add_row(sens_controls)
 
         # Show message if any
-        if self.ui_message and (time.time() - self.ui_message_time < 3):
-            controls.add_row(Text(self.ui_message, style=f"{self.theme['warning']} italic"))
+        message, shown_at = self._ui_state
+        if message and (time.time() - shown_at < 3):
+            controls.add_row(Text(message, style=f"{self.theme['warning']} italic"))
 
         return Panel(
             controls,
@@ -1030,44 +1457,114 @@ class FireworksVoiceTranslator:
 
         # Main structure
         layout.split_column(
-            Layout(self.create_header(), size=3),
+            Layout(self.create_header(), name="header", size=3),
             Layout(name="main"),
-            Layout(self.create_controls_panel(), size=4)
+            Layout(self.create_controls_panel(), name="controls", size=4)
         )
 
-        # Split main area based on history visibility
-        if self.show_history:
-            # With history panel - original layout
-            layout["main"].split_row(
-                Layout(name="left", ratio=1),
-                Layout(name="center", ratio=3),
-                Layout(name="right", ratio=1)
-            )
+        # The history column always exists; toggling it only flips visibility
+        layout["main"].split_row(
+            Layout(name="left", ratio=1),
+            Layout(name="center", ratio=3),
+            Layout(name="right", ratio=1)
+        )
 
-            # Right side - History
-            layout["main"]["right"].split_column(
-                self.create_history_panel()
-            )
-        else:
-            # Without history panel - use more space for other panels
-            layout["main"].split_row(
-                Layout(name="left", ratio=1),
-                Layout(name="center", ratio=4)  # Center gets all the extra space
-            )
+        # Right side - History
+        layout["main"]["right"].split_column(
+            Layout(self.create_history_panel(), name="history")
+        )
+        self._apply_history_visibility(layout)
 
         # Left side - Status
         layout["main"]["left"].split_column(
-            Layout(self.create_status_panel()),
-            Layout(self.create_stats_panel())
+            Layout(self.create_status_panel(), name="status"),
+            Layout(self.create_stats_panel(), name="stats")
         )
 
         # Center - Translation
         layout["main"]["center"].split_column(
-            self.create_translation_panel()
+            Layout(self.create_translation_panel(), name="translation")
         )
 
         return layout
 
+    def _apply_history_visibility(self, layout):
+        """Show or hide the history column; the center takes its space when hidden"""
+        layout["main"]["right"].visible = self.show_history
+        layout["main"]["center"].ratio = self.CENTER_RATIOS[self.show_history]
+
+    def _mark_dirty(self, *panels):
+        """Queue panels for rebuild and wake the UI loop (safe from any thread)"""
+        self._dirty.update(panels)
+        wake_w = self._wake_w
+        if wake_w is not None:
+            try:
+                os.write(wake_w, b"x")
+            except OSError:
+                pass  # Pipe full (a wake-up is already pending) or closing
+
+    def _panel_snapshot(self):
+        """State each polled panel is drawn from; a panel is rebuilt only when its entry changes"""
+        message, shown_at = self._ui_state
+        return {
+            'status': (self.target_lang, self.is_recording, self.is_processing, self.is_speaking,
+                       self.api_state, self.api_status, self.whisper_model, self.sensitivity_mode),
+            'controls': (message, shown_at, time.time() - shown_at < 3),
+            'stats': (self.show_stats, self._stats_version),
+        }
+
+    def refresh_layout(self, live):
+        """Bring the live layout up to date, rebuilding only the panels that changed.
+        Returns True when the screen needs a redraw."""
+        dirty = self._dirty.copy()
+        self._dirty.difference_update(dirty)
+
+        # Polled changes are throttled to panel_refresh_interval; explicitly marked
+        # panels and the controls line (keyboard feedback) rebuild right away
+        now = time.monotonic()
+        snapshot = self._panel_snapshot()
+        for name, key in snapshot.items():
+            if self._panel_keys.get(name) == key:
+                continue
+            if name == 'controls' or name in dirty or now - self._panel_built.get(name, 0.0) >= self.panel_refresh_interval:
+                dirty.add(name)
+                self._panel_keys[name] = key
+
+        if self._layout is None:
+            self._build_layout()
+            live.update(self._layout)
+            self._panel_keys = snapshot
+            return True
+
+        # Self-drawing cells (meter, session clock) only need a redraw, capped at 10 Hz
+        redraw_key = (self.create_audio_meter(),
+                      int(now - self._session_start_mono) if self.show_stats else None)
+        redraw = bool(dirty)
+        if redraw_key != self._redraw_key and now - self._last_redraw >= self.meter_refresh_interval:
+            self._redraw_key = redraw_key
+            redraw = True
+        if redraw:
+            self._last_redraw = now
+
+        # Swap new panels into the existing nodes; the tree itself is left alone
+        nodes = self._nodes
+        builders = self._panel_builders
+        for name in dirty:
+            if name == 'history' and not self.show_history:
+                continue  # Hidden; rebuilt when it is shown again
+            node = nodes.get(name)
+            if node is None:  # Panel not part of the current layout
+                continue
+            node.update(builders[name]())
+            self._panel_built[name] = now
+        return redraw
+
+    def _build_layout(self):
+        """Build the layout tree and keep direct references to its panel nodes"""
+        self._layout = self.create_layout()
+        self._nodes = {name: self._layout.get(name) for name in self._panel_builders}
+        self._panel_built = dict.fromkeys(self._panel_builders, time.monotonic())
+
     def select_languages(self):
         """Language selection interface"""
         self.console.clear()
@@ -1095,9 +1592,9 @@ class FireworksVoiceTranslator:
             self.target_lang = target
             self.stats['languages_used'].add(target)
 
+        # Confirm on the live view's status line instead of pausing here
         updated = f"Auto-detect → {self.target_lang} {self.LANGUAGES[self.target_lang][1]}"
-        self.console.print(f"\n[green]✓ Updated:[/] {updated}")
-        time.sleep(1.5)
+        self._ui_state = (f"✓ Updated: {updated}", time.time())
 
     def run(self):
         """Main application loop"""
@@ -1118,57 +1615,75 @@ class FireworksVoiceTranslator:
             # Clear screen
             self.console.clear()
 
+            # One selector waits on both keypresses and wake-ups from other threads,
+            # so the UI loop sleeps until there is input, a change, or a meter tick
+            sel = selectors.DefaultSelector()
+            sel.register(sys.stdin, selectors.EVENT_READ)
+            wake_r, wake_w = os.pipe()
+            os.set_blocking(wake_r, False)
+            os.set_blocking(wake_w, False)
+            sel.register(wake_r, selectors.EVENT_READ)
+            self._wake_w = wake_w
+
             # Main UI loop
-            with Live(self.create_layout(), refresh_per_second=10, screen=True) as live:
+            if self._layout is None:
+                self._build_layout()
+            # No auto-refresh thread: the screen is redrawn only when something changed
+            with Live(self._layout, auto_refresh=False, screen=True) as live:
                 while self.is_running:
-                    # Update display
-                    live.update(self.create_layout())
-
-                    # Check for keyboard input
-                    import select
-                    if sys.stdin in select.select([sys.stdin], [], [], 0.05)[0]:
-                        key = sys.stdin.read(1)
-
-                        if key.lower() == 'q':
-                            self.is_running = False
-                        elif key.lower() == 'l':
-                            live.stop()
-                            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                            self.select_languages()
-                            tty.setcbreak(fd)
-                            self.console.clear()
-                            live.start()
-                        elif key == ' ':
-                            self.is_recording = not self.is_recording
-                            self.ui_message = "Recording paused" if not self.is_recording else "Recording resumed"
-                            self.ui_message_time = time.time()
-                        elif key.lower() == 'h':
-                            self.show_history = not self.show_history
-                        elif key.lower() == 's':
-                            self.show_stats = not self.show_stats
-                        elif key.lower() == 'c':
-                            self.history.clear()
-                            for key in ['total_translations', 'total_words', 'total_latency', 
-                                       'avg_latency', 'api_calls', 'api_errors', 'fireworks_savings']:
-                                if key in self.stats:
-                                    self.stats[key] = 0
-                            self.ui_message = "History cleared"
-                            self.ui_message_time = time.time()
-                        elif key.lower() == 't':
-                            # Test mode - send a test transcription
-                            live.stop()
-                            self.console.print("\n[cyan]Testing API directly...[/]")
-                            test_data = np.random.randint(-1000, 1000, 16000, dtype=np.int16).tobytes()
-                            self.transcribe_with_fireworks(test_data)
-                            time.sleep(2)
-                            self.console.clear()
-                            live.start()
-                        elif key in ['+', '-', '=', '0']:
-                            self.adjust_sensitivity(key)
-                        elif key == '\n' or key == '\r':  # Enter key
-                            self.save_to_file()
-
-                    time.sleep(0.02)  # Faster refresh for ultra-low latency
+                    # Update display (unchanged panels are reused as-is)
+                    if self.refresh_layout(live):
+                        live.refresh()
+
+                    # Sleep until a keypress, a wake-up, or the next meter tick
+                    key = None
+                    for event, _ in sel.select(timeout=self.meter_refresh_interval):
+                        if event.fd == wake_r:
+                            try:
+                                os.read(wake_r, 4096)  # Drain; the dirty set says what changed
+                            except BlockingIOError:
+                                pass
+                        else:
+                            key = sys.stdin.read(1)
+                            if not key:  # stdin closed
+                                sel.unregister(sys.stdin)
+                    if not key:
+                        continue
+
+                    if key.lower() == 'q':
+                        self.is_running = False
+                    elif key.lower() == 'l':
+                        live.stop()
+                        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                        self.select_languages()
+                        tty.setcbreak(fd)
+                        self.console.clear()
+                        live.start(refresh=True)
+                    elif key == ' ':
+                        self.is_recording = not self.is_recording
+                        self._ui_state = ("Recording paused" if not self.is_recording else "Recording resumed", time.time())
+                        self._mark_dirty('status')
+                    elif key.lower() == 'h':
+                        self.show_history = not self.show_history
+                        self._apply_history_visibility(self._layout)
+                        self._mark_dirty('history')
+                    elif key.lower() == 's':
+                        self.show_stats = not self.show_stats
+                        self._mark_dirty('stats')
+                    elif key.lower() == 'c':
+                        self.history.clear()
+                        self.stats.update(self._ZEROED_STATS)
+                        self._stats_version += 1
+                        self._mark_dirty('translation', 'history')
+                        self._ui_state = ("History cleared", time.time())
+                    elif key.lower() == 't':
+                        # Test mode - send a test transcription without leaving the live view
+                        self.submit_test_transcription(self._test_pcm)
+                    elif key in ['+', '-', '=', '0']:
+                        self.adjust_sensitivity(key)
+                        self._mark_dirty('status')
+                    elif key == '\n' or key == '\r':  # Enter key
+                        self.save_to_file()
 
         except KeyboardInterrupt:
             pass
@@ -1179,14 +1694,20 @@ class FireworksVoiceTranslator:
             except:
                 pass
 
+            # Stop wake-ups before closing the pipe they write to
+            if self._wake_w is not None:
+                self._wake_w = None
+                sel.close()
+                os.close(wake_r)
+                os.close(wake_w)
+
             # Cleanup
-            if hasattr(self, 'executor'):
-                self.executor.shutdown(wait=False)
             if hasattr(self, 'stream'):
                 self.stream.stop_stream()
                 self.stream.close()
             if hasattr(self, 'pyaudio'):
                 self.pyaudio.terminate()
+            self.close()
 
             # Show exit message
             self.console.clear()
@@ -1206,39 +1727,42 @@ class FireworksVoiceTranslator:
                 self.console.print(f"  • Time saved: [green]{self.stats['fireworks_savings']/60:.1f} minutes[/]")
 
                 # Cost calculation with new pricing
-                whisper_cost = (self.stats['total_audio_duration'] / 60) * 0.0015
-                # Gemini is free tier or minimal cost
-                translation_cost = 0.0  # Using free tier
-                total_cost = whisper_cost + translation_cost
+                total_cost = self.session_costs()[2]
                 self.console.print(f"  • Total cost: [green]${total_cost:.5f}[/]")
 
 def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="VoiceTrans - Ultra-low latency Voice Translator")
-    parser.add_argument('-t', '--target', default='zh', help='Target language code')
-    parser.add_argument('--theme', default='dark', choices=['dark', 'light'], help='UI theme')
-    parser.add_argument('--fireworks-key', help='Fireworks API key')
-    parser.add_argument('--gemini-key', help='Google Gemini API key for translation')
-    parser.add_argument('--openai-key', help='[Deprecated] Use --gemini-key instead')
-    parser.add_argument('--turbo', action='store_true', default=True, help='Use turbo model (default: True)')
-
-    args = parser.parse_args()
-
-    # Set API keys if provided
-    if args.fireworks_key:
-        os.environ['FIREWORKS_API_KEY'] = args.fireworks_key
-    if args.gemini_key:
-        os.environ['GEMINI_API_KEY'] = args.gemini_key
-    elif args.openai_key:  # Backward compatibility
-        os.environ['GEMINI_API_KEY'] = args.openai_key
-        print("Warning: --openai-key is deprecated. Please use --gemini-key instead.")
+    # Defaults; the argument parser is only built when there are arguments
+    target, theme, turbo = 'zh', 'dark', True
+
+    if len(sys.argv) > 1:
+        import argparse
+        parser = argparse.ArgumentParser(description="VoiceTrans - Ultra-low latency Voice Translator")
+        parser.add_argument('-t', '--target', default=target, help='Target language code')
+        parser.add_argument('--theme', default=theme, choices=['dark', 'light'], help='UI theme')
+        parser.add_argument('--fireworks-key', help='Fireworks API key')
+        parser.add_argument('--gemini-key', help='Google Gemini API key for translation')
+        parser.add_argument('--openai-key', help='[Deprecated] Use --gemini-key instead')
+        parser.add_argument('--turbo', action='store_true', default=turbo, help='Use turbo model (default: True)')
+
+        args = parser.parse_args()
+
+        # Set API keys if provided
+        if args.fireworks_key:
+            os.environ['FIREWORKS_API_KEY'] = args.fireworks_key
+        if args.gemini_key:
+            os.environ['GEMINI_API_KEY'] = args.gemini_key
+        elif args.openai_key:  # Backward compatibility
+            os.environ['GEMINI_API_KEY'] = args.openai_key
+            print("Warning: --openai-key is deprecated. Please use --gemini-key instead.")
+
+        target, theme, turbo = args.target, args.theme, args.turbo
 
     app = FireworksVoiceTranslator(
-        target=args.target,
-        theme=args.theme
+        target=target,
+        theme=theme
     )
     
-    app.use_turbo_model = args.turbo
+    app.use_turbo_model = turbo
     app.run()
 
 if __name__ == "__main__":
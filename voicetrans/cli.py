@@ -5,11 +5,16 @@ VoiceTrans CLI - Command line interface for VoiceTrans
 
 import os
 import sys
-import argparse
 from pathlib import Path
 
 def main():
     """Main CLI entry point for VoiceTrans"""
+    # Plain `vtrans` is the common case: start straight away, no argument parser
+    if len(sys.argv) == 1:
+        run_app({})
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(
         description="VoiceTrans - Ultra-low latency Voice Translator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -54,7 +59,7 @@ Examples:
 
     # Handle version flag
     if args.version:
-        from voicetrans import __version__
+        from voicetrans._version import __version__
         print(f"VoiceTrans v{__version__}")
         sys.exit(0)
 
@@ -84,9 +89,6 @@ Examples:
         os.environ['GEMINI_API_KEY'] = args.openai_key
         print("Warning: --openai-key is deprecated. Please use --gemini-key instead.")
 
-    # Import and run the main app
-    from voicetrans.app import FireworksVoiceTranslator
-
     # Prepare kwargs from arguments
     kwargs = {}
     if args.target:
@@ -94,12 +96,23 @@ Examples:
     if args.theme:
         kwargs['theme'] = args.theme
 
+    run_app(kwargs, turbo=args.turbo)
+
+def run_app(kwargs, turbo=None):
+    """Create the translator and run it until the user quits"""
+    # Import and run the main app
+    from voicetrans.app import FireworksVoiceTranslator
+
     # Create and run the app
-    app = FireworksVoiceTranslator(**kwargs)
+    try:
+        app = FireworksVoiceTranslator(**kwargs)
+    except RuntimeError as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
 
     # Set turbo mode if specified
-    if args.turbo is not None:
-        app.use_turbo_model = args.turbo
+    if turbo is not None:
+        app.use_turbo_model = turbo
 
     # Run the application
     try:
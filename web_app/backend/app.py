@@ -3,15 +3,54 @@
 FastAPI backend for VoiceTrans - Working Version without CORS Middleware
 """
 
-from fastapi import FastAPI, UploadFile, File, WebSocket
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, UploadFile, File, WebSocket
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from typing import Optional, List
+from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
+import gzip
 import json
+import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_bytes(obj) -> bytes:
+    """Compact UTF-8 JSON, encoded by orjson when it's installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Wall-clock timestamp for responses, refreshed every 100ms by _tick_clock()
+# so handlers don't build and format a datetime per request
+_now_iso = datetime.now().isoformat()
+
+async def _tick_clock():
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(0.1)
+
+@asynccontextmanager
+async def lifespan(app):
+    clock = asyncio.create_task(_tick_clock())
+    try:
+        yield
+    finally:
+        clock.cancel()
 
 # Create the FastAPI app
-app = FastAPI(title="VoiceTrans API", version="1.0.0")
+app = FastAPI(
+    title="VoiceTrans API",
+    version="1.0.0",
+    lifespan=lifespan,
+)
 
 # Models
 class ConfigRequest(BaseModel):
@@ -35,14 +74,57 @@ LANGUAGES = {
     'hi': ('Hindi', '🇮🇳'),
 }
 
-stats = {
-    'total_translations': 0,
-    'total_words': 0,
-    'avg_latency': 0.0,
-    'total_latency': 0.0,
-    'api_calls': 0,
-    'api_errors': 0
-}
+# The language list never changes, so its JSON body is encoded once here
+_LANGUAGES = [
+    {"code": code, "name": name, "flag": flag}
+    for code, (name, flag) in LANGUAGES.items()
+]
+_LANGUAGES_JSON_BYTES = _json_bytes(_LANGUAGES)
+_LANGUAGES_JSON_GZ = gzip.compress(_LANGUAGES_JSON_BYTES, 9)
+
+class StatsCounters:
+    """Translation counters as plain slot attributes, with a throttled JSON snapshot"""
+
+    __slots__ = ('total_translations', 'total_words', 'total_latency',
+                 'api_calls', 'api_errors', '_json', '_json_at')
+
+    JSON_MAX_AGE = 1.0  # seconds a serialized snapshot may be served stale
+
+    def __init__(self):
+        self.total_translations = 0
+        self.total_words = 0
+        self.total_latency = 0.0
+        self.api_calls = 0
+        self.api_errors = 0
+        self._json = b""
+        self._json_at = float('-inf')
+
+    def record_translation(self, words: int, latency: float):
+        self.total_translations += 1
+        self.total_words += words
+        self.total_latency += latency
+
+    def as_dict(self) -> dict:
+        n = self.total_translations
+        return {
+            'total_translations': n,
+            'total_words': self.total_words,
+            'avg_latency': self.total_latency / n if n else 0.0,
+            'total_latency': self.total_latency,
+            'api_calls': self.api_calls,
+            'api_errors': self.api_errors,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialized as_dict(), rebuilt at most once per JSON_MAX_AGE"""
+        now = time.monotonic()
+        if now - self._json_at >= self.JSON_MAX_AGE:
+            self._json = _json_bytes(self.as_dict())
+            self._json_at = now
+        return self._json
+
+
+stats = StatsCounters()
 
 is_initialized = False
 
@@ -53,45 +135,60 @@ CORS_HEADERS = {
     "Access-Control-Allow-Headers": "*",
 }
 
+# Preflight response headers, encoded once at import
+PREFLIGHT_HEADERS = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in CORS_HEADERS.items()
+]
+
+
+class PreflightMiddleware:
+    """Answer every OPTIONS request with an empty 204 before it reaches the router"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "OPTIONS":
+            await send({"type": "http.response.start", "status": 204, "headers": PREFLIGHT_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(GZipMiddleware, minimum_size=256)
+app.add_middleware(PreflightMiddleware)
+
 # Endpoints
-@app.get("/")
-async def root():
-    return JSONResponse(
-        content={
-            "status": "online",
-            "service": "VoiceTrans API",
-            "version": "1.0.0",
-            "initialized": is_initialized,
-            "stats": stats
-        },
-        headers=CORS_HEADERS
-    )
+# Status body with the constant fields encoded once; only initialized and stats vary
+_ROOT_TEMPLATE = (
+    b'{"status":"online","service":"VoiceTrans API","version":"1.0.0",'
+    b'"initialized":%s,"stats":%s}'
+)
 
-@app.options("/")
-async def root_options():
-    return JSONResponse(content={}, headers=CORS_HEADERS)
+@app.get("/", response_class=Response)
+async def root():
+    body = _ROOT_TEMPLATE % (b"true" if is_initialized else b"false", stats.to_json())
+    return Response(content=body, media_type="application/json", headers=CORS_HEADERS)
 
 @app.get("/languages")
-async def get_languages():
-    return JSONResponse(
-        content=[
-            {"code": code, "name": info[0], "flag": info[1]}
-            for code, info in LANGUAGES.items()
-        ],
+async def get_languages(request: Request):
+    # Already-compressed bodies are passed through untouched by GZipMiddleware
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_LANGUAGES_JSON_GZ,
+            media_type="application/json",
+            headers={**CORS_HEADERS, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(
+        content=_LANGUAGES_JSON_BYTES,
+        media_type="application/json",
         headers=CORS_HEADERS
     )
 
-@app.options("/languages")
-async def languages_options():
-    return JSONResponse(content={}, headers=CORS_HEADERS)
-
 @app.get("/stats")
 async def get_stats():
-    return JSONResponse(content=stats, headers=CORS_HEADERS)
-
-@app.options("/stats")
-async def stats_options():
-    return JSONResponse(content={}, headers=CORS_HEADERS)
+    return Response(content=stats.to_json(), media_type="application/json", headers=CORS_HEADERS)
 
 @app.post("/config")
 async def update_config(config: ConfigRequest):
@@ -103,17 +200,11 @@ async def update_config(config: ConfigRequest):
         headers=CORS_HEADERS
     )
 
-@app.options("/config")
-async def config_options():
-    return JSONResponse(content={}, headers=CORS_HEADERS)
-
 @app.post("/translate")
 async def translate_audio(file: UploadFile = File(...), target_language: str = "zh"):
-    audio_data = await file.read()
-
-    # Mock response
-    stats['total_translations'] += 1
-    stats['api_calls'] += 1
+    # Mock response; the upload itself is never read into memory
+    stats.total_translations += 1
+    stats.api_calls += 1
 
     return JSONResponse(
         content={
@@ -122,15 +213,23 @@ async def translate_audio(file: UploadFile = File(...), target_language: str = "
             "target_language": target_language,
             "latency": 0.5,
             "processing_speed": 2.0,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso
         },
         headers=CORS_HEADERS
     )
 
-@app.options("/translate")
-async def translate_options():
-    return JSONResponse(content={}, headers=CORS_HEADERS)
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop + httptools when installed; fall back to the pure-Python defaults
+    # where they aren't (uvloop has no Windows build)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, loop=loop, http=http, ws="websockets")
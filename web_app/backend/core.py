@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Shared pieces of the VoiceTrans backends: languages, models, the service
+skeleton and the common HTTP endpoints
+"""
+
+import os
+import json
+import asyncio
+import tempfile
+from typing import Optional, Dict, Any
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+# Fireworks AI via OpenAI client
+try:
+    import httpx
+    from openai import OpenAI
+    HAS_OPENAI = True
+except ImportError:
+    HAS_OPENAI = False
+    print("Warning: OpenAI library not installed")
+
+# Google Gemini for translation
+try:
+    from google import genai
+    HAS_GENAI = True
+except ImportError:
+    HAS_GENAI = False
+    print("Warning: Google GenAI library not installed")
+
+FIREWORKS_BASE_URL = "https://audio-prod.us-virginia-1.direct.fireworks.ai/v1"
+
+# Connection pool for Fireworks calls: HTTP/2 with long-lived keep-alive so
+# requests after the first skip the TCP+TLS handshake
+HTTP_POOL_OPTIONS = {
+    'http2': True,
+    'limits': httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=120),
+    'timeout': httpx.Timeout(30.0, connect=5.0)
+} if HAS_OPENAI else {}
+
+LANGUAGES = {
+    'en': ('English', '🇬🇧'),
+    'zh': ('Chinese', '🇨🇳'),
+    'es': ('Spanish', '🇪🇸'),
+    'fr': ('French', '🇫🇷'),
+    'de': ('German', '🇩🇪'),
+    'ja': ('Japanese', '🇯🇵'),
+    'ko': ('Korean', '🇰🇷'),
+    'ru': ('Russian', '🇷🇺'),
+    'ar': ('Arabic', '🇸🇦'),
+    'pt': ('Portuguese', '🇵🇹'),
+    'it': ('Italian', '🇮🇹'),
+    'hi': ('Hindi', '🇮🇳'),
+    'nl': ('Dutch', '🇳🇱'),
+    'pl': ('Polish', '🇵🇱'),
+    'tr': ('Turkish', '🇹🇷'),
+    'sv': ('Swedish', '🇸🇪'),
+    'da': ('Danish', '🇩🇰'),
+    'no': ('Norwegian', '🇳🇴'),
+    'fi': ('Finnish', '🇫🇮')
+}
+
+# Pydantic models
+class LanguageInfo(BaseModel):
+    code: str
+    name: str
+    flag: str
+
+class ConfigRequest(BaseModel):
+    fireworks_api_key: Optional[str] = None
+    gemini_api_key: Optional[str] = None
+    default_target_language: Optional[str] = "zh"
+
+class TranslationResponse(BaseModel):
+    transcription: str
+    translation: str
+    target_language: str
+    latency: float
+    processing_speed: float
+    timestamp: str
+
+class BaseTranslationService:
+    """API clients, configuration state and stats shared by every backend"""
+    LANGUAGES = LANGUAGES
+
+    def __init__(self):
+        self.fireworks_client = None
+        self.gemini_client = None
+        self.is_initialized = False
+
+        # Clients are only rebuilt when their key changes; the HTTP pool is
+        # created once and shared by every Fireworks client this service makes
+        self._fireworks_key = None
+        self._gemini_key = None
+        self._http = None
+
+        # Stats; avg_latency is derived in stats_snapshot()
+        self.stats = {
+            'total_translations': 0,
+            'total_words': 0,
+            'total_latency': 0.0,
+            'api_calls': 0,
+            'api_errors': 0
+        }
+
+    def initialize(self, fireworks_key: Optional[str] = None, gemini_key: Optional[str] = None):
+        """Initialize API clients"""
+        if fireworks_key and HAS_OPENAI and fireworks_key != self._fireworks_key:
+            try:
+                self.fireworks_client = self.create_fireworks_client(fireworks_key)
+                self._fireworks_key = fireworks_key
+                print("Fireworks client initialized")
+            except Exception as e:
+                print(f"Failed to initialize Fireworks: {e}")
+
+        if gemini_key and HAS_GENAI and gemini_key != self._gemini_key:
+            try:
+                self.gemini_client = genai.Client(api_key=gemini_key)
+                self._gemini_key = gemini_key
+                print("Gemini client initialized")
+            except Exception as e:
+                print(f"Failed to initialize Gemini: {e}")
+
+        success = bool(fireworks_key) and fireworks_key == self._fireworks_key
+        self.is_initialized = success
+        return success
+
+    def create_fireworks_client(self, api_key: str):
+        """Fireworks client on the shared pool; subclasses that await their calls return AsyncOpenAI"""
+        if self._http is None:
+            self._http = httpx.Client(**HTTP_POOL_OPTIONS)
+        return OpenAI(base_url=FIREWORKS_BASE_URL, api_key=api_key, http_client=self._http)
+
+    def stats_snapshot(self) -> Dict:
+        """Stats with avg_latency derived at read time"""
+        total = self.stats['total_translations']
+        return {
+            **self.stats,
+            'avg_latency': self.stats['total_latency'] / total if total else 0.0
+        }
+
+# Serializes POST /config writes so concurrent requests can't interleave
+_config_lock = asyncio.Lock()
+
+def _write_config(data: Dict[str, Any]):
+    """Write config.json via a temp file so readers never see a partial file"""
+    # Unique name in the same directory: os.replace stays atomic, and other
+    # processes writing the config never share (or clobber) the temp file
+    f = tempfile.NamedTemporaryFile('w', dir='.', prefix='config.', suffix='.tmp', delete=False)
+    try:
+        with f:
+            json.dump(data, f, indent=2)
+        os.replace(f.name, 'config.json')
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+def register_common_routes(app: FastAPI, service: BaseTranslationService,
+                           root_info: Optional[Dict[str, Any]] = None,
+                           save_config: bool = True):
+    """Add /, /languages, /stats and /config to app
+
+    root_info is merged into the / status payload; save_config controls
+    whether POST /config persists the keys to config.json.
+    """
+    root_info = root_info or {}
+    languages = [
+        {
+            "code": code,
+            "name": info[0],
+            "flag": info[1]
+        }
+        for code, info in service.LANGUAGES.items()
+    ]
+
+    @app.get("/")
+    async def root():
+        """Root endpoint - API status"""
+        return {
+            "status": "online",
+            **root_info,
+            "initialized": service.is_initialized,
+            "stats": service.stats_snapshot()
+        }
+
+    @app.get("/languages")
+    async def get_languages():
+        """Get list of supported languages"""
+        return languages
+
+    @app.get("/stats")
+    async def get_stats():
+        """Get translation statistics"""
+        return service.stats_snapshot()
+
+    @app.post("/config")
+    async def update_config(config: ConfigRequest):
+        """Update API configuration"""
+        try:
+            success = service.initialize(
+                fireworks_key=config.fireworks_api_key,
+                gemini_key=config.gemini_api_key
+            )
+
+            if save_config:
+                config_data = {
+                    'fireworks_api_key': config.fireworks_api_key or '',
+                    'gemini_api_key': config.gemini_api_key or '',
+                    'default_target_language': config.default_target_language
+                }
+                async with _config_lock:
+                    await asyncio.to_thread(_write_config, config_data)
+
+            return {
+                "status": "configured" if success else "failed",
+                "initialized": service.is_initialized
+            }
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
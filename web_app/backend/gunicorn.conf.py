@@ -0,0 +1,20 @@
+"""
+Gunicorn settings for the backend: one UvicornWorker by default, more with
+WEB_CONCURRENCY once service state is shared between processes:
+    gunicorn main:app -c gunicorn.conf.py
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Each worker is a separate uvicorn event loop with its own copy of the service
+# state (API keys, initialized flag, stats, rate-limit buckets), and POST /config
+# only reaches the worker that receives it. Until that state lives in a shared
+# store, run a single worker; WEB_CONCURRENCY overrides the count.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+
+keepalive = 5
+timeout = 60
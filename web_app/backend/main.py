@@ -4,17 +4,21 @@ FastAPI backend for VoiceTrans Web Application - Simplified Version
 """
 
 import os
+import gzip
 import json
 import asyncio
 import io
 import wave
 import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-from fastapi import FastAPI, WebSocket, UploadFile, File, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Request, WebSocket, UploadFile, File, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 # Try imports with fallbacks
@@ -32,21 +36,156 @@ except ImportError:
     HAS_GENAI = False
     print("Warning: Google GenAI library not installed")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_bytes(obj) -> bytes:
+    """Compact UTF-8 JSON, encoded by orjson when it's installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Wall-clock timestamp for responses, refreshed every 100ms by _tick_clock()
+# so handlers don't build and format a datetime per request
+_now_iso = datetime.now().isoformat()
+
+async def _tick_clock():
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(0.1)
+
+@asynccontextmanager
+async def lifespan(app):
+    clock = asyncio.create_task(_tick_clock())
+    try:
+        yield
+    finally:
+        clock.cancel()
+
 # Create FastAPI app first
 app = FastAPI(
     title="VoiceTrans API",
     description="Real-time voice translation API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+class FastCORSMiddleware:
+    """Pure-ASGI CORS for a fixed policy: any origin, credentials, all methods and headers.
+
+    Header tuples are encoded once here; preflights are answered without reaching
+    the router and other responses get the CORS headers appended in `send`.
+    Since credentials are allowed, the request's Origin is echoed instead of "*".
+    """
+
+    ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app, max_age: int = 600):
+        self.app = app
+        self._simple_headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self._preflight_headers = self._simple_headers + [
+            (b"access-control-allow-methods", self.ALLOW_METHODS),
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        if origin is None:  # Not a cross-origin request
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            headers = [(b"access-control-allow-origin", origin)] + self._preflight_headers
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin)] + self._simple_headers
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+class RateLimitASGIMiddleware:
+    """Per-client-IP token bucket, kept in process and checked straight from the ASGI scope.
+
+    Each IP may burst up to `per_minute` requests and refills at `per_minute / 60`
+    per second. A rejected request gets a prebuilt 429 without reaching the app.
+    """
+
+    MAX_BUCKETS = 10_000  # Forget the least recently seen IPs past this many
+
+    def __init__(self, app, per_minute: int = 120):
+        self.app = app
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        # ip -> (tokens, last_refill_monotonic), least recently seen first
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+        self._body = b'{"detail":"Too Many Requests"}'
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._body)).encode()),
+            (b"retry-after", str(max(1, round(1 / self.rate))).encode()),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        ip = client[0] if client else ""
+        now = time.monotonic()
+        tokens, last = self._buckets.get(ip, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last) * self.rate)
+        allowed = tokens >= 1.0
+        self._buckets[ip] = (tokens - 1.0 if allowed else tokens, now)
+        self._buckets.move_to_end(ip)
+        if len(self._buckets) > self.MAX_BUCKETS:
+            # The oldest entry has had the longest to refill, so forgetting it
+            # (it restarts full) costs the least accuracy
+            self._buckets.popitem(last=False)
+
+        if not allowed:
+            await send({"type": "http.response.start", "status": 429, "headers": self._headers})
+            await send({"type": "http.response.body", "body": self._body})
+            return
+        await self.app(scope, receive, send)
+
+app.add_middleware(GZipMiddleware, minimum_size=256)
+
+# Rate limiting sits inside CORS so preflights are never counted and 429s still carry CORS headers
+RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "0"))  # Opt-in; 0 disables
+if RATE_LIMIT_PER_MINUTE > 0:
+    app.add_middleware(RateLimitASGIMiddleware, per_minute=RATE_LIMIT_PER_MINUTE)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORSMiddleware)
 
 # Pydantic models
 class LanguageInfo(BaseModel):
@@ -128,30 +267,39 @@ class SimpleTranslationService:
 service = SimpleTranslationService()
 
 # API Endpoints
-@app.get("/")
+# Status body with the constant fields encoded once; only initialized and stats vary
+_ROOT_TEMPLATE = (
+    b'{"status":"online","service":"VoiceTrans API","version":"1.0.0",'
+    b'"initialized":%s,"stats":%s,'
+    + b'"has_openai":' + _json_bytes(HAS_OPENAI)
+    + b',"has_genai":' + _json_bytes(HAS_GENAI) + b'}'
+)
+
+@app.get("/", response_class=Response)
 async def root():
     """Root endpoint - API status"""
-    return {
-        "status": "online",
-        "service": "VoiceTrans API",
-        "version": "1.0.0",
-        "initialized": service.is_initialized,
-        "stats": service.stats,
-        "has_openai": HAS_OPENAI,
-        "has_genai": HAS_GENAI
-    }
+    body = _ROOT_TEMPLATE % (
+        b"true" if service.is_initialized else b"false",
+        _json_bytes(service.stats),
+    )
+    return Response(content=body, media_type="application/json")
+
+# The language list never changes, so its JSON body is encoded once here
+_LANGUAGES = [
+    {"code": code, "name": name, "flag": flag}
+    for code, (name, flag) in SimpleTranslationService.LANGUAGES.items()
+]
+_LANGUAGES_JSON_BYTES = _json_bytes(_LANGUAGES)
+_LANGUAGES_JSON_GZ = gzip.compress(_LANGUAGES_JSON_BYTES, 9)
+_GZIP_HEADERS = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
 
 @app.get("/languages")
-async def get_languages():
+async def get_languages(request: Request):
     """Get list of supported languages"""
-    return [
-        {
-            "code": code,
-            "name": info[0],
-            "flag": info[1]
-        }
-        for code, info in service.LANGUAGES.items()
-    ]
+    # Already-compressed bodies are passed through untouched by GZipMiddleware
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(content=_LANGUAGES_JSON_GZ, media_type="application/json", headers=_GZIP_HEADERS)
+    return Response(content=_LANGUAGES_JSON_BYTES, media_type="application/json")
 
 @app.get("/stats")
 async def get_stats():
@@ -193,7 +341,7 @@ async def translate_audio(
         "target_language": target_language,
         "latency": 0.5,
         "processing_speed": 2.0,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso
     }
 
 @app.websocket("/ws")
@@ -210,4 +358,16 @@ async def websocket_endpoint(websocket: WebSocket):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop + httptools when installed; fall back to the pure-Python defaults
+    # where they aren't (uvloop has no Windows build)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, loop=loop, http=http, ws="websockets")
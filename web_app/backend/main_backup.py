@@ -8,19 +8,22 @@ import os
 import sys
 import json
 import asyncio
-import io
+import hashlib
 import wave
+import struct
 import tempfile
+import time
 import numpy as np
 from datetime import datetime
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from concurrent.futures import ThreadPoolExecutor
 
 # FastAPI and related
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException, Depends
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 # OpenAI SDK for Fireworks
@@ -48,8 +51,92 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Thread pool for parallel processing
-executor = ThreadPoolExecutor(max_workers=4)
+# Websocket audio chunks that may be transcribing/translating at once per connection
+MAX_CHUNKS_IN_FLIGHT = 4
+
+# Uploads are copied into the WAV wrapper this many bytes at a time
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Canonical 44-byte PCM WAV header: RIFF chunk, 16-byte fmt chunk, data chunk
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+def wav_header(data_size: int, sample_rate: int, channels: int = 1, sampwidth: int = 2) -> bytes:
+    """WAV header for data_size bytes of little-endian PCM"""
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * channels * sampwidth, channels * sampwidth, sampwidth * 8,
+        b"data", data_size
+    )
+
+def is_wav(head: bytes) -> bool:
+    """True if head starts with a RIFF/WAVE signature"""
+    return head[:4] == b"RIFF" and head[8:12] == b"WAVE"
+
+def take_bytes(frames: deque, size: int) -> bytes:
+    """Pop exactly size bytes off the front of a deque of frames, joining them once"""
+    parts = []
+    while size:
+        frame = frames.popleft()
+        if len(frame) > size:
+            frames.appendleft(frame[size:])
+            frame = frame[:size]
+        parts.append(frame)
+        size -= len(frame)
+    return b"".join(parts)
+
+# Thread pool for the blocking Fireworks/Gemini SDK calls; each one mostly waits on
+# the network, so size it like the stdlib default rather than a fixed 4
+executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 5),
+    thread_name_prefix="api"
+)
+
+class StatsCounters:
+    """Translation counters as plain slot attributes, with a throttled JSON snapshot"""
+
+    __slots__ = ('total_translations', 'total_words', 'total_latency',
+                 'api_calls', 'api_errors', 'cache_hits', 'cache_misses',
+                 '_json', '_json_at')
+
+    JSON_MAX_AGE = 1.0  # seconds a serialized snapshot may be served stale
+
+    def __init__(self):
+        self.total_translations = 0
+        self.total_words = 0
+        self.total_latency = 0.0
+        self.api_calls = 0
+        self.api_errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._json = b""
+        self._json_at = float('-inf')
+
+    def record_translation(self, words: int, latency: float):
+        self.total_translations += 1
+        self.total_words += words
+        self.total_latency += latency
+
+    def as_dict(self) -> dict:
+        n = self.total_translations
+        return {
+            'total_translations': n,
+            'total_words': self.total_words,
+            'avg_latency': self.total_latency / n if n else 0.0,
+            'total_latency': self.total_latency,
+            'api_calls': self.api_calls,
+            'api_errors': self.api_errors,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialized as_dict(), rebuilt at most once per JSON_MAX_AGE"""
+        now = time.monotonic()
+        if now - self._json_at >= self.JSON_MAX_AGE:
+            self._json = json.dumps(self.as_dict()).encode("utf-8")
+            self._json_at = now
+        return self._json
 
 # Pydantic models for request/response
 class TranslationRequest(BaseModel):
@@ -108,14 +195,11 @@ class TranslationService:
         self.sample_rate = 16000
         self.whisper_model = "whisper-v3"
         self.is_initialized = False
-        self.stats = {
-            'total_translations': 0,
-            'total_words': 0,
-            'avg_latency': 0.0,
-            'total_latency': 0.0,
-            'api_calls': 0,
-            'api_errors': 0
-        }
+        self.stats = StatsCounters()
+        # LRU caches for repeated audio and text; only touched from the event loop
+        self.cache_size = 4096
+        self._transcription_cache = OrderedDict()
+        self._translation_cache = OrderedDict()
         self.load_config()
 
     def load_config(self):
@@ -155,28 +239,58 @@ class TranslationService:
                 print(f"Failed to initialize Gemini client: {e}")
                 self.gemini_client = None
 
+    def _open_wav(self, fileobj):
+        """Open a mono 16-bit WAV writer at the service sample rate over fileobj"""
+        wf = wave.open(fileobj, 'wb')
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(self.sample_rate)
+        return wf
+
     async def transcribe_audio(self, audio_data: bytes) -> str:
         """Transcribe audio using Fireworks API"""
+        # Repeated audio is answered from the cache
+        audio_key = hashlib.blake2b(audio_data, digest_size=16).digest()
+        text = self._cache_get(self._transcription_cache, audio_key)
+        if text is not None:
+            return text
+
+        # Raw PCM just needs a header; WAV input is sent as is
+        if not is_wav(audio_data):
+            audio_data = wav_header(len(audio_data), self.sample_rate) + audio_data
+        text = await self._transcribe_wav(audio_data)
+        self._cache_put(self._transcription_cache, audio_key, text)
+        return text
+
+    def _cache_get(self, cache, key):
+        """Look up a cached result, marking it as recently used"""
+        value = cache.get(key)
+        if value is None:
+            self.stats.cache_misses += 1
+            return None
+        cache.move_to_end(key)
+        self.stats.cache_hits += 1
+        return value
+
+    def _cache_put(self, cache, key, value):
+        """Store a result, evicting the least recently used entry when full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    async def _transcribe_wav(self, wav) -> str:
+        """Transcribe WAV given as bytes or a readable file object"""
         if not self.fireworks_client:
             raise HTTPException(status_code=503, detail="Transcription service not initialized")
 
         try:
-            # Create WAV file in memory
-            audio_buffer = io.BytesIO()
-            with wave.open(audio_buffer, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data)
-
-            wav_bytes = audio_buffer.getvalue()
-
             # Call Fireworks API
-            transcription = await asyncio.get_event_loop().run_in_executor(
+            transcription = await asyncio.get_running_loop().run_in_executor(
                 executor,
                 lambda: self.fireworks_client.audio.transcriptions.create(
                     model=self.whisper_model,
-                    file=("audio.wav", wav_bytes, "audio/wav")
+                    file=("audio.wav", wav, "audio/wav")
                 )
             )
 
@@ -186,11 +300,11 @@ class TranslationService:
             else:
                 text = str(transcription).strip()
 
-            self.stats['api_calls'] += 1
+            self.stats.api_calls += 1
             return text
 
         except Exception as e:
-            self.stats['api_errors'] += 1
+            self.stats.api_errors += 1
             raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
     async def translate_text(self, text: str, target_language: str) -> str:
@@ -198,12 +312,16 @@ class TranslationService:
         if not self.gemini_client:
             return text  # Return original text if translation not available
 
+        cache_key = (text, target_language)
+        cached = self._cache_get(self._translation_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            language_name = self.LANGUAGES.get(target_language, ('Unknown', ''))[0]
-            prompt = f"Translate the following text to {language_name}. Output only the translation, nothing else:\n\n{text}"
+            prompt = _PROMPT_PREFIXES.get(target_language, _UNKNOWN_PROMPT_PREFIX) + text
 
             # Use Gemini for translation
-            response = await asyncio.get_event_loop().run_in_executor(
+            response = await asyncio.get_running_loop().run_in_executor(
                 executor,
                 lambda: self.gemini_client.models.generate_content(
                     model="gemini-2.5-flash-lite-preview-09-2025",
@@ -212,7 +330,9 @@ class TranslationService:
             )
 
             if response and response.text:
-                return response.text.strip()
+                translated = response.text.strip()
+                self._cache_put(self._translation_cache, cache_key, translated)
+                return translated
             return text
 
         except Exception as e:
@@ -221,25 +341,43 @@ class TranslationService:
 
     async def process_audio(self, audio_data: bytes, target_language: str) -> Dict[str, Any]:
         """Process audio: transcribe and translate"""
-        import time
+        return await self._process(self.transcribe_audio(audio_data), len(audio_data), target_language)
+
+    async def process_upload(self, upload: UploadFile, target_language: str) -> Dict[str, Any]:
+        """Process an uploaded PCM or WAV file, streaming PCM into a spooled WAV instead of reading it whole"""
+        if is_wav(await upload.read(12)):
+            # Already a WAV: hand the upload's own file over untouched
+            await upload.seek(0)
+            pcm_bytes = max(0, (upload.size or 0) - _WAV_HEADER.size)
+            return await self._process(self._transcribe_wav(upload.file), pcm_bytes, target_language)
+
+        await upload.seek(0)
+        pcm_bytes = 0
+        with tempfile.SpooledTemporaryFile(max_size=1 << 20) as wav:
+            with self._open_wav(wav) as wf:
+                while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                    wf.writeframes(chunk)
+                    pcm_bytes += len(chunk)
+            wav.seek(0)
+            return await self._process(self._transcribe_wav(wav), pcm_bytes, target_language)
+
+    async def _process(self, transcribing, pcm_bytes: int, target_language: str) -> Dict[str, Any]:
+        """Await a transcription coroutine, translate its text and record metrics"""
         start_time = time.time()
 
         # Transcribe
-        transcription = await self.transcribe_audio(audio_data)
+        transcription = await transcribing
 
         # Translate
         translation = await self.translate_text(transcription, target_language)
 
         # Calculate metrics
         latency = time.time() - start_time
-        audio_duration = len(audio_data) / (self.sample_rate * 2)  # 2 bytes per sample
+        audio_duration = pcm_bytes / (self.sample_rate * 2)  # 2 bytes per sample
         processing_speed = audio_duration / latency if latency > 0 else 0
 
         # Update statistics
-        self.stats['total_translations'] += 1
-        self.stats['total_words'] += len(transcription.split())
-        self.stats['total_latency'] += latency
-        self.stats['avg_latency'] = self.stats['total_latency'] / self.stats['total_translations']
+        self.stats.record_translation(len(transcription.split()), latency)
 
         return {
             'transcription': transcription,
@@ -250,10 +388,20 @@ class TranslationService:
             'timestamp': datetime.now().isoformat()
         }
 
+# Translation prompt prefix per language code, built once
+_PROMPT_TEMPLATE = "Translate the following text to {}. Output only the translation, nothing else:\n\n"
+_PROMPT_PREFIXES = {
+    code: _PROMPT_TEMPLATE.format(name)
+    for code, (name, _flag) in TranslationService.LANGUAGES.items()
+}
+_UNKNOWN_PROMPT_PREFIX = _PROMPT_TEMPLATE.format('Unknown')
+
 # Initialize service
 service = TranslationService()
 
-# Dependency to ensure service is initialized
+# Ensures the service is initialized. Called directly rather than through
+# Depends(): a sync dependency costs a threadpool hop and a dependency
+# resolution pass on every request
 def get_service():
     if not service.is_initialized:
         service.initialize_clients()
@@ -269,16 +417,17 @@ async def root():
         "service": "VoiceTrans API",
         "version": "1.0.0",
         "initialized": service.is_initialized,
-        "stats": service.stats
+        "stats": service.stats.as_dict()
     }
 
-@app.get("/languages", response_model=List[LanguageInfo])
+# Schema kept for the OpenAPI docs only; no response_model means no per-request validation
+@app.get("/languages", responses={200: {"model": List[LanguageInfo]}})
 async def get_languages():
     """Get list of supported languages"""
-    return [
-        LanguageInfo(code=code, name=info[0], flag=info[1])
+    return JSONResponse(content=[
+        {"code": code, "name": info[0], "flag": info[1]}
         for code, info in service.LANGUAGES.items()
-    ]
+    ])
 
 @app.post("/config")
 async def update_config(config: ConfigRequest):
@@ -298,67 +447,101 @@ async def update_config(config: ConfigRequest):
 @app.post("/translate", response_model=TranslationResponse)
 async def translate_audio(
     audio: UploadFile = File(...),
-    target_language: str = "zh",
-    _service: TranslationService = Depends(get_service)
+    target_language: str = "zh"
 ):
     """Translate audio file"""
-    # Read audio data
-    audio_data = await audio.read()
-
-    # Process audio
-    result = await _service.process_audio(audio_data, target_language)
+    result = await get_service().process_upload(audio, target_language)
 
     return TranslationResponse(**result)
 
 @app.get("/stats")
 async def get_stats():
     """Get translation statistics"""
-    return service.stats
+    return Response(content=service.stats.to_json(), media_type="application/json")
 
 # WebSocket for real-time translation
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time audio streaming"""
+    """WebSocket endpoint for real-time audio streaming
+
+    Binary frames carry PCM audio. The target language is set once with
+    ?target_language=xx on connect; a text frame {"target_language": "xx"}
+    changes it mid-stream.
+    """
     await websocket.accept()
     _service = get_service()
+    target_language = websocket.query_params.get('target_language', 'zh')
+
+    # Chunks are processed concurrently so one chunk's translation overlaps the
+    # next one's transcription; results are still sent in arrival order. The
+    # bounded queue caps how many chunks can be in flight at once.
+    in_flight = asyncio.Queue(maxsize=MAX_CHUNKS_IN_FLIGHT)
+
+    async def send_results():
+        while True:
+            task = await in_flight.get()
+            try:
+                result = await task
+            except Exception as e:
+                result = {
+                    'error': str(e),
+                    'timestamp': datetime.now().isoformat()
+                }
+            await websocket.send_json(result)
+
+    sender = asyncio.create_task(send_results())
 
     try:
-        audio_buffer = bytearray()
+        # Received frames are queued as is and only joined when a chunk is cut,
+        # rather than re-slicing one growing buffer
+        audio_frames = deque()
+        buffered = 0
         chunk_size = 16000 * 2  # 1 second of audio at 16kHz, 16-bit
 
         while True:
-            # Receive audio data
-            data = await websocket.receive_bytes()
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                raise WebSocketDisconnect(message.get('code', 1000))
 
-            # Add to buffer
-            audio_buffer.extend(data)
+            data = message.get('bytes')
+            if data is None:
+                # Control frame: only sent when the client changes language
+                config = json.loads(message.get('text') or '{}')
+                target_language = config.get('target_language', target_language)
+                continue
 
-            # Process when we have enough data
-            if len(audio_buffer) >= chunk_size:
-                # Extract chunk
-                chunk = bytes(audio_buffer[:chunk_size])
-                audio_buffer = audio_buffer[chunk_size:]
+            # Add to buffer
+            audio_frames.append(data)
+            buffered += len(data)
 
-                # Get target language from client message
-                text_data = await websocket.receive_text()
-                config = json.loads(text_data) if text_data else {}
-                target_language = config.get('target_language', 'zh')
+            # Process every full chunk we have
+            while buffered >= chunk_size:
+                chunk = take_bytes(audio_frames, chunk_size)
+                buffered -= chunk_size
 
                 # Process audio
-                try:
-                    result = await _service.process_audio(chunk, target_language)
-                    await websocket.send_json(result)
-                except Exception as e:
-                    await websocket.send_json({
-                        'error': str(e),
-                        'timestamp': datetime.now().isoformat()
-                    })
+                chunk_task = asyncio.create_task(_service.process_audio(chunk, target_language))
+                queued = asyncio.create_task(in_flight.put(chunk_task))
+                await asyncio.wait((queued, sender), return_when=asyncio.FIRST_COMPLETED)
+                if sender.done():
+                    # Sending failed (the socket closed under it), so nothing
+                    # drains in_flight any more; stop instead of blocking on put
+                    queued.cancel()
+                    chunk_task.cancel()
+                    if not sender.cancelled():
+                        print(f"WebSocket send failed: {sender.exception()}")
+                    raise WebSocketDisconnect(1006)
 
     except WebSocketDisconnect:
         print("WebSocket disconnected")
     except Exception as e:
         print(f"WebSocket error: {e}")
         await websocket.close()
+    finally:
+        # Nobody is left to receive pending results
+        sender.cancel()
+        while not in_flight.empty():
+            in_flight.get_nowait().cancel()
 
 if __name__ == "__main__":
     import uvicorn
@@ -32,8 +32,12 @@ try:
 except ImportError:
     genai = None
 
-# Thread pool for parallel processing
-executor = ThreadPoolExecutor(max_workers=4)
+# Thread pool for the blocking Fireworks/Gemini SDK calls; each one mostly waits on
+# the network, so size it like the stdlib default rather than a fixed 4
+executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 5),
+    thread_name_prefix="api"
+)
 
 # Pydantic models for request/response
 class TranslationRequest(BaseModel):
@@ -156,7 +160,7 @@ class TranslationService:
             wav_bytes = audio_buffer.getvalue()
 
             # Call Fireworks API
-            transcription = await asyncio.get_event_loop().run_in_executor(
+            transcription = await asyncio.get_running_loop().run_in_executor(
                 executor,
                 lambda: self.fireworks_client.audio.transcriptions.create(
                     model=self.whisper_model,
@@ -187,7 +191,7 @@ class TranslationService:
             prompt = f"Translate the following text to {language_name}. Output only the translation, nothing else:\n\n{text}"
 
             # Use Gemini for translation
-            response = await asyncio.get_event_loop().run_in_executor(
+            response = await asyncio.get_running_loop().run_in_executor(
                 executor,
                 lambda: self.gemini_client.models.generate_content(
                     model="gemini-2.5-flash-lite-preview-09-2025",
@@ -279,13 +283,14 @@ async def root():
         "stats": service.stats
     }
 
-@app.get("/languages", response_model=List[LanguageInfo])
+# Schema kept for the OpenAPI docs only; no response_model means no per-request validation
+@app.get("/languages", responses={200: {"model": List[LanguageInfo]}})
 async def get_languages():
     """Get list of supported languages"""
-    return [
-        LanguageInfo(code=code, name=info[0], flag=info[1])
+    return JSONResponse(content=[
+        {"code": code, "name": info[0], "flag": info[1]}
         for code, info in service.LANGUAGES.items()
-    ]
+    ])
 
 @app.post("/config")
 async def update_config(config: ConfigRequest):
@@ -6,21 +6,27 @@ FastAPI backend for VoiceTrans - Real-time streaming version with WebSocket
 import os
 import json
 import asyncio
-import io
-import wave
+import hashlib
+import struct
 import time
-import base64
-import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Set, Tuple
+from collections import OrderedDict, deque
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import numpy as np
 
+try:
+    from .core import (HAS_OPENAI, HAS_GENAI, FIREWORKS_BASE_URL, HTTP_POOL_OPTIONS,
+                       BaseTranslationService, register_common_routes)
+except ImportError:  # run from inside backend/
+    from core import (HAS_OPENAI, HAS_GENAI, FIREWORKS_BASE_URL, HTTP_POOL_OPTIONS,
+                      BaseTranslationService, register_common_routes)
+
 # Audio processing
 try:
     import webrtcvad
@@ -29,29 +35,116 @@ except ImportError:
     HAS_VAD = False
     print("Warning: webrtcvad not installed")
 
-# Fireworks AI via OpenAI client
+# Optional cache shared by every worker (enabled by REDIS_URL)
+try:
+    import redis.asyncio as redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+# Optional JIT for the per-chunk VAD state machine
 try:
-    from openai import OpenAI
-    HAS_OPENAI = True
+    from numba import njit
 except ImportError:
-    HAS_OPENAI = False
-    print("Warning: OpenAI library not installed")
+    njit = None
 
-# Google Gemini for translation
+# Optional WebRTC transport for browsers (POST /rtc/offer)
 try:
-    from google import genai
-    HAS_GENAI = True
+    import av
+    from aiortc import RTCPeerConnection, RTCSessionDescription
+    from aiortc.mediastreams import MediaStreamError
+    HAS_AIORTC = True
 except ImportError:
-    HAS_GENAI = False
-    print("Warning: Google GenAI library not installed")
+    HAS_AIORTC = False
+
+# Awaitable Fireworks client for the realtime path
+if HAS_OPENAI:
+    import httpx
+    from openai import AsyncOpenAI
+
+def _wav_header(sample_rate, data_size):
+    """44-byte RIFF header for mono 16-bit PCM"""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, 1,
+        sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+
+# Compressed upload formats a client can pick with ?codec=; sent to Fireworks
+# as-is, without decoding on this server
+ENCODED_FORMATS = {
+    'webm': ('audio.webm', 'audio/webm'),
+    'ogg': ('audio.ogg', 'audio/ogg')
+}
+
+# What TranslationSession.feed() does with a chunk after a VAD step
+_VAD_IDLE = 0  # Not recording; drop it
+_VAD_START = 1  # Speech onset: reset the buffer, then append
+_VAD_APPEND = 2
+_VAD_END = 3  # Append, then send the utterance (trailing silence reached)
+_VAD_MAX = 4  # Append, then send the utterance (max duration reached)
+
+def _vad_step(state, is_speech, now_ns, min_speech_chunks, silence_threshold, max_recording_ns):
+    """Advance the per-connection VAD state by one chunk and return the action
+
+    state is an int64 array [speech_chunks, silence_chunks, is_recording, recording_start_ns].
+    """
+    action = _VAD_IDLE
+    if is_speech:
+        state[0] += 1
+        state[1] = 0
+        if state[2] == 0:
+            if state[0] >= min_speech_chunks:
+                state[2] = 1
+                state[3] = now_ns
+                action = _VAD_START
+        else:
+            action = _VAD_APPEND
+    else:
+        state[1] += 1
+        if state[2] != 0:
+            action = _VAD_APPEND
+            if state[1] >= silence_threshold:
+                state[0] = 0
+                state[1] = 0
+                state[2] = 0
+                return _VAD_END
+
+    if state[2] != 0 and now_ns - state[3] > max_recording_ns:
+        state[0] = 0
+        state[1] = 0
+        state[2] = 0
+        return _VAD_MAX
+    return action
+
+if njit is not None:
+    _vad_step = njit(cache=True)(_vad_step)
+
+# Open WebRTC peer connections, closed on shutdown
+peer_connections: Set = set()
+# Seconds a peer gets to open its data channel before we hang up
+RTC_CHANNEL_TIMEOUT = 30
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await asyncio.gather(*(pc.close() for pc in peer_connections))
+    peer_connections.clear()
 
 # Create FastAPI app
 app = FastAPI(
     title="VoiceTrans Real-time API",
     description="Real-time voice translation API with WebSocket streaming",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
+class RTCOfferRequest(BaseModel):
+    sdp: str
+    type: str
+    target_language: Optional[str] = "zh"
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -61,58 +154,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Pydantic models
-class LanguageInfo(BaseModel):
-    code: str
-    name: str
-    flag: str
-
-class ConfigRequest(BaseModel):
-    fireworks_api_key: Optional[str] = None
-    gemini_api_key: Optional[str] = None
-    default_target_language: Optional[str] = "zh"
-
-class TranslationResponse(BaseModel):
-    transcription: str
-    translation: str
-    target_language: str
-    latency: float
-    processing_speed: float
-    timestamp: str
-
 # Real-time translation service
-class RealtimeTranslationService:
-    LANGUAGES = {
-        'en': ('English', '🇬🇧'),
-        'zh': ('Chinese', '🇨🇳'),
-        'es': ('Spanish', '🇪🇸'),
-        'fr': ('French', '🇫🇷'),
-        'de': ('German', '🇩🇪'),
-        'ja': ('Japanese', '🇯🇵'),
-        'ko': ('Korean', '🇰🇷'),
-        'ru': ('Russian', '🇷🇺'),
-        'ar': ('Arabic', '🇸🇦'),
-        'pt': ('Portuguese', '🇵🇹'),
-        'it': ('Italian', '🇮🇹'),
-        'hi': ('Hindi', '🇮🇳'),
-        'nl': ('Dutch', '🇳🇱'),
-        'pl': ('Polish', '🇵🇱'),
-        'tr': ('Turkish', '🇹🇷'),
-        'sv': ('Swedish', '🇸🇪'),
-        'da': ('Danish', '🇩🇰'),
-        'no': ('Norwegian', '🇳🇴'),
-        'fi': ('Finnish', '🇫🇮')
-    }
-
+class RealtimeTranslationService(BaseTranslationService):
     def __init__(self):
-        self.fireworks_client = None
-        self.gemini_client = None
-        self.is_initialized = False
+        super().__init__()
 
         # VAD settings (similar to CLI)
         self.sample_rate = 16000
         self.chunk_size = 480  # 30ms chunks
+        # Only the two size fields change per upload
+        self._wav_header_template = bytearray(_wav_header(self.sample_rate, 0))
         self.vad_level = 2  # Moderate aggressive VAD
+        self.energy_floor = 150  # Mean |sample| below this is silence without asking the VAD
 
         if HAS_VAD:
             self.vad = webrtcvad.Vad(self.vad_level)
@@ -123,134 +176,264 @@ class RealtimeTranslationService:
         self.silence_threshold = 25  # 750ms of silence
         self.min_speech_chunks = 10  # 300ms minimum speech
         self.max_recording_duration = 5  # 5s max
+        self.max_queued_utterances = 4  # Per connection, waiting for transcription
+        self.max_encoded_bytes = 256 * 1024  # Per utterance from WebM/Ogg Opus clients
 
-        # Stats
-        self.stats = {
-            'total_translations': 0,
-            'total_words': 0,
-            'avg_latency': 0.0,
-            'total_latency': 0.0,
-            'api_calls': 0,
-            'api_errors': 0,
-            'active_connections': 0
+        # Translation prompt prefix per language code, built once
+        self._prompt_prefixes = {
+            code: f"Translate this to {name}: " for code, (name, _flag) in self.LANGUAGES.items()
         }
 
-        # Active WebSocket connections
-        self.active_connections: List[WebSocket] = []
+        # Whisper reports the detected language as a code or an English name
+        self._language_codes = {name.lower(): code for code, (name, _flag) in self.LANGUAGES.items()}
+        self._language_codes.update({code: code for code in self.LANGUAGES})
 
-    def initialize(self, fireworks_key: Optional[str] = None, gemini_key: Optional[str] = None):
-        """Initialize API clients"""
-        success = False
+        # Cache counters alongside the base stats
+        self.stats['cache_hits'] = 0
+        self.stats['cache_misses'] = 0
 
-        if fireworks_key and HAS_OPENAI:
-            try:
-                self.fireworks_client = OpenAI(
-                    base_url="https://audio-prod.us-virginia-1.direct.fireworks.ai/v1",
-                    api_key=fireworks_key
-                )
-                success = True
-                print("Fireworks client initialized")
-            except Exception as e:
-                print(f"Failed to initialize Fireworks: {e}")
+        # LRU caches: transcripts keyed by an audio digest, translations by (text, language)
+        self.cache_size = 512
+        self._asr_cache = OrderedDict()
+        self._mt_cache = OrderedDict()
 
-        if gemini_key and HAS_GENAI:
-            try:
-                self.gemini_client = genai.Client(api_key=gemini_key)
-                print("Gemini client initialized")
-            except Exception as e:
-                print(f"Failed to initialize Gemini: {e}")
+        # Behind the LRUs, a Redis cache shared across workers and hosts; any
+        # Redis failure just counts as a miss
+        redis_url = os.getenv('REDIS_URL')
+        self.redis = None
+        if redis_url and HAS_REDIS:
+            self.redis = redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        self.shared_cache_ttl = 86400
+        self.stats['shared_cache_hits'] = 0
+
+        # Transcriptions in flight, keyed by audio digest, so identical audio
+        # arriving while its request is still out shares that request
+        self._in_flight: Dict[bytes, asyncio.Task] = {}
 
-        self.is_initialized = success
-        return success
+        # Active WebSocket connections
+        self.active_connections: Set[WebSocket] = set()
+
+    def create_fireworks_client(self, api_key: str):
+        if self._http is None:
+            self._http = httpx.AsyncClient(**HTTP_POOL_OPTIONS)
+        return AsyncOpenAI(base_url=FIREWORKS_BASE_URL, api_key=api_key, http_client=self._http)
 
     async def connect(self, websocket: WebSocket):
         """Add WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        self.stats['active_connections'] = len(self.active_connections)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        self.stats['active_connections'] = len(self.active_connections)
+        self.active_connections.discard(websocket)
+
+    async def transcribe(self, audio_data: bytes,
+                         container: Optional[str] = None) -> Optional[Tuple[str, Optional[str]]]:
+        """Transcribe with Fireworks; None if nothing was heard or the call failed
 
-    async def process_audio_chunk(self, audio_data: bytes, target_language: str = "zh") -> Optional[Dict]:
-        """Process audio chunk and return translation if speech detected"""
+        audio_data is 16-bit PCM, or a complete file in one of ENCODED_FORMATS
+        when container names it. Returns (text, detected language code).
+        """
         if not self.is_initialized or not self.fireworks_client:
             return None
 
-        try:
-            start_time = time.time()
-
-            # Create temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                # Write WAV header and data
-                with wave.open(tmp_file.name, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(self.sample_rate)
-                    wav_file.writeframes(audio_data)
-
-                # Transcribe with Fireworks
-                with open(tmp_file.name, 'rb') as audio_file:
-                    transcription = self.fireworks_client.audio.transcriptions.create(
-                        model="whisper-v3",
-                        file=audio_file,
-                        response_format="text"
-                    )
-
-                # Clean up temp file
-                os.unlink(tmp_file.name)
-
-            if not transcription or transcription.strip() == "":
-                return None
-
-            # Translate if needed
-            translation = transcription
-            if target_language != "en" and self.gemini_client:
-                try:
-                    lang_name = self.LANGUAGES.get(target_language, (target_language, ''))[0]
-                    prompt = f"Translate this to {lang_name}: {transcription}"
-
-                    response = self.gemini_client.models.generate_content(
-                        model="gemini-2.0-flash-exp",
-                        config={"response_modalities": ["TEXT"], "temperature": 0},
-                        contents=prompt
-                    )
-                    translation = response.text.strip()
-                except Exception as e:
-                    print(f"Translation error: {e}")
-                    translation = transcription
-
-            # Calculate metrics
-            latency = time.time() - start_time
-            audio_duration = len(audio_data) / (self.sample_rate * 2)  # 16-bit audio
-            processing_speed = audio_duration / latency if latency > 0 else 0
-
-            # Update stats
-            self.stats['total_translations'] += 1
-            self.stats['total_words'] += len(transcription.split())
-            self.stats['total_latency'] += latency
-            self.stats['avg_latency'] = self.stats['total_latency'] / self.stats['total_translations']
-            self.stats['api_calls'] += 1
-
-            return {
-                "transcription": transcription,
-                "translation": translation,
-                "target_language": target_language,
-                "latency": round(latency, 3),
-                "processing_speed": round(processing_speed, 2),
-                "timestamp": datetime.now().isoformat()
-            }
+        # Repeated audio (wake phrases, short commands) skips the round-trip
+        audio_key = hashlib.blake2b(audio_data, digest_size=16).digest()
+        cached = self._cache_get(self._asr_cache, audio_key)
+        if cached is not None:
+            return cached
+        cached = await self._shared_get(b'asr:' + audio_key)
+        if cached is not None:
+            # Stored as "<language>\n<text>"
+            language, _, text = cached.partition('\n')
+            result = (text, language or None)
+            self._cache_put(self._asr_cache, audio_key, result)
+            return result
+
+        task = self._in_flight.get(audio_key)
+        if task is None:
+            task = asyncio.create_task(self._transcribe_and_store(audio_key, audio_data, container))
+            self._in_flight[audio_key] = task
+            # A done callback runs even if the task is cancelled before it starts
+            task.add_done_callback(lambda done: self._in_flight.pop(audio_key, None)
+                                   if self._in_flight.get(audio_key) is done else None)
+
+        # Shielded: one caller going away must not cancel a result others share.
+        # The task always finishes (result, exception or cancellation), so no
+        # waiter is left blocked.
+        return await asyncio.shield(task)
+
+    async def _transcribe_and_store(self, audio_key: bytes, audio_data: bytes,
+                                    container: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
+        """Request a transcription and cache it locally and in Redis"""
+        result = await self._request_transcription(audio_data, container)
+        if result is not None:
+            self._cache_put(self._asr_cache, audio_key, result)
+            await self._shared_put(b'asr:' + audio_key, f"{result[1] or ''}\n{result[0]}")
+        return result
+
+    async def _request_transcription(self, audio_data: bytes,
+                                     container: Optional[str] = None) -> Optional[Tuple[str, Optional[str]]]:
+        """One Fireworks transcription call; None if nothing was heard or it failed"""
+        if container is None:
+            upload = ("audio.wav", self._build_wav(audio_data), "audio/wav")
+        else:
+            filename, mime = ENCODED_FORMATS[container]
+            upload = (filename, audio_data, mime)
 
+        try:
+            # Awaited, so other connections keep being served while this one
+            # waits on the network
+            # verbose_json also reports the detected language, which lets
+            # translate() skip Gemini when it already matches the target
+            response = await self.fireworks_client.audio.transcriptions.create(
+                model="whisper-v3",
+                file=upload,
+                response_format="verbose_json"
+            )
         except Exception as e:
             print(f"Processing error: {e}")
             self.stats['api_errors'] += 1
             return None
 
+        transcription = (response.text or "").strip()
+        if not transcription:
+            return None
+        language = getattr(response, 'language', None)
+        if language:
+            language = self._language_codes.get(language.lower(), language.lower())
+        return transcription, language or None
+
+    async def translate(self, transcription: str, target_language: str,
+                        source_language: Optional[str] = None) -> str:
+        """Translate with Gemini, falling back to the transcription itself
+
+        Speech already in the target language is returned unchanged; when the
+        source language is unknown, English is assumed.
+        """
+        if (source_language or "en") == target_language or not self.gemini_client:
+            return transcription
+
+        cache_key = (transcription, target_language)
+        cached = self._cache_get(self._mt_cache, cache_key)
+        if cached is not None:
+            return cached
+        shared_key = b'mt:' + hashlib.blake2b(f"{target_language}:{transcription}".encode(), digest_size=16).digest()
+        cached = await self._shared_get(shared_key)
+        if cached is not None:
+            self._cache_put(self._mt_cache, cache_key, cached)
+            return cached
+
+        try:
+            prefix = self._prompt_prefixes.get(target_language)
+            if prefix is None:
+                prefix = f"Translate this to {target_language}: "
+            prompt = prefix + transcription
+
+            response = await self.gemini_client.aio.models.generate_content(
+                model="gemini-2.0-flash-exp",
+                config={"response_modalities": ["TEXT"], "temperature": 0},
+                contents=prompt
+            )
+            translation = response.text.strip()
+            self._cache_put(self._mt_cache, cache_key, translation)
+            await self._shared_put(shared_key, translation)
+            return translation
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return transcription
+
+    def stats_snapshot(self) -> Dict:
+        """Stats with avg_latency and active_connections derived at read time"""
+        return {
+            **super().stats_snapshot(),
+            'active_connections': len(self.active_connections)
+        }
+
+    def _build_wav(self, audio_data: bytes) -> bytes:
+        """WAV bytes for 16-bit PCM, patching the sizes into the prebuilt header"""
+        header = bytearray(self._wav_header_template)
+        struct.pack_into('<I', header, 4, 36 + len(audio_data))
+        struct.pack_into('<I', header, 40, len(audio_data))
+        return b''.join((header, audio_data))
+
+    def _cache_get(self, cache, key):
+        """Look up a cached result, marking it as recently used"""
+        value = cache.get(key)
+        if value is None:
+            self.stats['cache_misses'] += 1
+            return None
+        cache.move_to_end(key)
+        self.stats['cache_hits'] += 1
+        return value
+
+    async def _shared_get(self, key: bytes) -> Optional[str]:
+        """Look up the Redis cache; None on a miss or if Redis is unavailable"""
+        if self.redis is None:
+            return None
+        try:
+            value = await self.redis.get(key)
+        except Exception as e:
+            print(f"Redis error: {e}")
+            return None
+        if value is None:
+            return None
+        self.stats['shared_cache_hits'] += 1
+        return value.decode()
+
+    async def _shared_put(self, key: bytes, value: str):
+        """Store in the Redis cache, ignoring failures"""
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key, value.encode(), ex=self.shared_cache_ttl)
+        except Exception as e:
+            print(f"Redis error: {e}")
+
+    def _cache_put(self, cache, key, value):
+        """Store a result, evicting the least recently used entry when full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def build_result(self, audio_data: bytes, transcription: str, translation: str,
+                     target_language: str, start_time: float,
+                     audio_duration: Optional[float] = None) -> Dict:
+        """Record stats for a finished utterance and build its result message
+
+        audio_duration is only needed for encoded audio; PCM is measured by length.
+        """
+        # Calculate metrics
+        latency = time.time() - start_time
+        if audio_duration is None:
+            audio_duration = len(audio_data) / (self.sample_rate * 2)  # 16-bit audio
+        processing_speed = audio_duration / latency if latency > 0 else 0
+
+        # Update stats
+        self.stats['total_translations'] += 1
+        self.stats['total_words'] += len(transcription.split())
+        self.stats['total_latency'] += latency
+        self.stats['api_calls'] += 1
+
+        return {
+            "transcription": transcription,
+            "translation": translation,
+            "target_language": target_language,
+            "latency": round(latency, 3),
+            "processing_speed": round(processing_speed, 2),
+            "timestamp": datetime.now().isoformat()
+        }
+
     def is_speech(self, audio_chunk: bytes) -> bool:
         """Check if audio chunk contains speech using VAD"""
+        # Cheap energy gate first: most chunks between utterances are near-silent
+        samples = np.frombuffer(audio_chunk, dtype=np.int16, count=len(audio_chunk) // 2)
+        if samples.size == 0:
+            return False  # Empty or single-byte frame: nothing to measure
+        if np.abs(samples, dtype=np.int32).mean() < self.energy_floor:
+            return False
+
         if not self.vad or not HAS_VAD:
             return True  # If no VAD, assume all audio is speech
 
@@ -290,77 +473,217 @@ def initialize_service():
 initialize_service()
 
 # API Endpoints
-@app.get("/")
-async def root():
-    """Root endpoint - API status"""
-    return {
-        "status": "online",
-        "service": "VoiceTrans Real-time API",
-        "version": "2.0.0",
-        "initialized": service.is_initialized,
-        "stats": service.stats,
-        "features": {
-            "websocket": True,
-            "vad": HAS_VAD,
-            "fireworks": HAS_OPENAI,
-            "gemini": HAS_GENAI
-        }
+register_common_routes(app, service, root_info={
+    "service": "VoiceTrans Real-time API",
+    "version": "2.0.0",
+    "features": {
+        "websocket": True,
+        "webrtc": HAS_AIORTC,
+        "vad": HAS_VAD,
+        "fireworks": HAS_OPENAI,
+        "gemini": HAS_GENAI
     }
+})
+
+class TranslationSession:
+    """VAD, buffering and the transcribe/translate workers for one client
+
+    Transport-agnostic: the WebSocket and WebRTC endpoints feed it 16-bit PCM
+    with feed() and JSON control messages with handle_control(); results go
+    back through the send coroutine the endpoint supplies.
+
+    With a container from ENCODED_FORMATS the client does its own VAD and sends
+    compressed audio instead: append_encoded() collects one utterance's file
+    and an {"type": "utterance_end", "duration": seconds} message (duration
+    required) submits it. An utterance over max_encoded_bytes is dropped whole.
+    """
+
+    def __init__(self, send, target_language: str = "zh", container: Optional[str] = None):
+        self.send = send
+        self.target_language = target_language
+        self.container = container
+        # Set when an encoded utterance overflowed; its remaining data is discarded
+        self.dropping_utterance = False
+
+        # Audio buffer for VAD; extended in place and cleared between
+        # utterances instead of collecting a list of small chunks
+        self.audio_buffer = bytearray()
+        # [speech_chunks, silence_chunks, is_recording, recording_start_ns], see _vad_step
+        self.vad_state = np.zeros(4, dtype=np.int64)
+        self.max_recording_ns = int(service.max_recording_duration * 1e9)
+
+        # Receiving/VAD is decoupled from the API calls by two stages joined
+        # with queues: transcribe_loop works through finished utterances while
+        # reply_loop translates and replies to the previous one, so audio is
+        # never left waiting on the network and replies stay in utterance order.
+        self.utterance_queue = asyncio.Queue(maxsize=service.max_queued_utterances)
+        self.transcript_queue = asyncio.Queue()
+        self.workers = []
+
+    def start(self):
+        """Start the worker tasks"""
+        self.workers = [asyncio.create_task(self.transcribe_loop()),
+                        asyncio.create_task(self.reply_loop())]
+
+    def close(self):
+        """Cancel the workers; nobody is left to receive the replies"""
+        for task in self.workers:
+            task.cancel()
+
+    async def transcribe_loop(self):
+        while True:
+            audio, duration, target_language, report_failure = await self.utterance_queue.get()
+            start_time = time.time()
+            result = await service.transcribe(audio, self.container)
+            await self.transcript_queue.put((audio, duration, result, target_language, report_failure, start_time))
 
-@app.get("/languages")
-async def get_languages():
-    """Get list of supported languages"""
-    return [
-        {
-            "code": code,
-            "name": info[0],
-            "flag": info[1]
-        }
-        for code, info in service.LANGUAGES.items()
-    ]
-
-@app.get("/stats")
-async def get_stats():
-    """Get translation statistics"""
-    return service.stats
-
-@app.post("/config")
-async def update_config(config: ConfigRequest):
-    """Update API configuration"""
-    try:
-        success = service.initialize(
-            fireworks_key=config.fireworks_api_key,
-            gemini_key=config.gemini_api_key
-        )
-
-        # Save config to file
-        config_data = {
-            'fireworks_api_key': config.fireworks_api_key or '',
-            'gemini_api_key': config.gemini_api_key or '',
-            'default_target_language': config.default_target_language
-        }
-
-        with open('config.json', 'w') as f:
-            json.dump(config_data, f, indent=2)
-
-        return {
-            "status": "configured" if success else "failed",
-            "initialized": service.is_initialized
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async def reply_loop(self):
+        while True:
+            audio, duration, result, target_language, report_failure, start_time = await self.transcript_queue.get()
+            if result is None:
+                if report_failure:
+                    await self.send({
+                        "type": "error",
+                        "message": "No speech detected or processing failed"
+                    })
+                continue
+            transcription, source_language = result
+
+            # Show the source text while its translation is still in flight
+            await self.send({
+                "type": "transcription",
+                "transcription": transcription
+            })
+
+            translation = await service.translate(transcription, target_language, source_language)
+            await self.send({
+                "type": "translation",
+                **service.build_result(audio, transcription, translation, target_language, start_time, duration)
+            })
+
+    async def start_utterance(self, audio, report_failure=True, duration=None):
+        if self.utterance_queue.full():
+            # Too far behind: drop the oldest waiting utterance rather than stall
+            self.utterance_queue.get_nowait()
+            await self.send({
+                "type": "error",
+                "message": "Falling behind, skipped an utterance"
+            })
+        self.utterance_queue.put_nowait((audio, duration, self.target_language, report_failure))
+
+    async def feed(self, audio_bytes: bytes):
+        """Run one chunk of raw 16-bit PCM, 16kHz mono through the VAD"""
+        action = _vad_step(self.vad_state, service.is_speech(audio_bytes), time.monotonic_ns(),
+                           service.min_speech_chunks, service.silence_threshold, self.max_recording_ns)
+        if action == _VAD_IDLE:
+            return
+
+        if action == _VAD_START:
+            self.audio_buffer.clear()
+            await self.send({
+                "type": "recording_started",
+                "message": "Speech detected"
+            })
+
+        self.audio_buffer.extend(audio_bytes)
+
+        if action == _VAD_END:
+            # Snapshot the utterance; the buffer is reused
+            full_audio = bytes(self.audio_buffer)
+            self.audio_buffer.clear()
+
+            await self.send({
+                "type": "processing",
+                "message": "Processing speech..."
+            })
+            await self.start_utterance(full_audio)
+
+        elif action == _VAD_MAX:
+            # Force process if recording too long
+            full_audio = bytes(self.audio_buffer)
+            self.audio_buffer.clear()
+            await self.start_utterance(full_audio, report_failure=False)
+
+    async def append_encoded(self, data: bytes):
+        """Collect part of a compressed utterance"""
+        if self.dropping_utterance:
+            return
+        self.audio_buffer.extend(data)
+        if len(self.audio_buffer) > service.max_encoded_bytes:
+            # A cut-off container can't be transcribed, and the rest would arrive
+            # without a header: drop the whole utterance up to its utterance_end
+            self.audio_buffer.clear()
+            self.dropping_utterance = True
+            await self.send({
+                "type": "error",
+                "message": "Utterance too long, dropped"
+            })
+
+    async def handle_control(self, message: Dict):
+        """Apply a JSON control message"""
+        if message.get("type") == "utterance_end":
+            if self.dropping_utterance:
+                self.dropping_utterance = False
+                return
+            if not self.container or not self.audio_buffer:
+                return
+
+            full_audio = bytes(self.audio_buffer)
+            self.audio_buffer.clear()
+
+            # Compressed audio can't be timed by its length, so the client must say
+            duration = message.get("duration")
+            if not isinstance(duration, (int, float)) or isinstance(duration, bool) or duration <= 0:
+                await self.send({
+                    "type": "error",
+                    "message": "utterance_end needs a positive duration in seconds"
+                })
+                return
+
+            await self.send({
+                "type": "processing",
+                "message": "Processing speech..."
+            })
+            await self.start_utterance(full_audio, duration=float(duration))
+
+        elif message.get("type") == "config":
+            # Update configuration
+            self.target_language = message.get("target_language", self.target_language)
+            await self.send({
+                "type": "config_updated",
+                "target_language": self.target_language
+            })
+
+        elif message.get("type") == "ping":
+            # Heartbeat
+            await self.send({
+                "type": "pong",
+                "timestamp": time.time()  # Epoch seconds; the client formats it if needed
+            })
 
 @app.websocket("/ws/translate")
 async def websocket_translate(websocket: WebSocket):
-    """WebSocket endpoint for real-time audio streaming and translation"""
+    """WebSocket endpoint for real-time audio streaming and translation
+
+    Audio arrives as binary frames of raw PCM. Text frames carry JSON control
+    messages: {"type": "config", "target_language": ...} and {"type": "ping"}.
+
+    Browsers can connect with ?codec=webm (or ogg) and send Opus, e.g. from
+    MediaRecorder restarted per utterance, ending each with an utterance_end
+    message; see TranslationSession.
+    """
     await service.connect(websocket)
 
-    # Audio buffer for VAD
-    audio_buffer = []
-    speech_chunks = 0
-    silence_chunks = 0
-    is_recording = False
-    recording_start = None
+    codec = websocket.query_params.get("codec", "pcm")
+    if codec != "pcm" and codec not in ENCODED_FORMATS:
+        await websocket.send_json({"type": "error", "message": f"Unsupported codec: {codec}"})
+        service.disconnect(websocket)
+        await websocket.close(code=1003)
+        return
+
+    session = TranslationSession(websocket.send_json, websocket.query_params.get("target_language", "zh"),
+                                 container=None if codec == "pcm" else codec)
+    session.start()
 
     try:
         # Send initial connection message
@@ -372,108 +695,21 @@ async def websocket_translate(websocket: WebSocket):
 
         while True:
             # Receive message from client
-            message = await websocket.receive_json()
-
-            if message.get("type") == "audio":
-                # Handle audio data
-                audio_base64 = message.get("data")
-                target_language = message.get("target_language", "zh")
-
-                if audio_base64:
-                    # Decode base64 audio
-                    audio_bytes = base64.b64decode(audio_base64)
-
-                    # Check for speech using VAD
-                    if service.is_speech(audio_bytes):
-                        speech_chunks += 1
-                        silence_chunks = 0
-
-                        if not is_recording and speech_chunks >= service.min_speech_chunks:
-                            # Start recording
-                            is_recording = True
-                            recording_start = time.time()
-                            audio_buffer = []
-
-                            await websocket.send_json({
-                                "type": "recording_started",
-                                "message": "Speech detected"
-                            })
-
-                        if is_recording:
-                            audio_buffer.append(audio_bytes)
-                    else:
-                        silence_chunks += 1
-
-                        if is_recording:
-                            audio_buffer.append(audio_bytes)
-
-                            # Check for end of speech
-                            if silence_chunks >= service.silence_threshold:
-                                # Process accumulated audio
-                                is_recording = False
-                                speech_chunks = 0
-                                silence_chunks = 0
-
-                                if audio_buffer:
-                                    # Combine audio chunks
-                                    full_audio = b''.join(audio_buffer)
-
-                                    # Send processing status
-                                    await websocket.send_json({
-                                        "type": "processing",
-                                        "message": "Processing speech..."
-                                    })
-
-                                    # Process audio
-                                    result = await service.process_audio_chunk(full_audio, target_language)
-
-                                    if result:
-                                        await websocket.send_json({
-                                            "type": "translation",
-                                            **result
-                                        })
-                                    else:
-                                        await websocket.send_json({
-                                            "type": "error",
-                                            "message": "No speech detected or processing failed"
-                                        })
-
-                                    audio_buffer = []
-
-                    # Check for max recording duration
-                    if is_recording and recording_start:
-                        if time.time() - recording_start > service.max_recording_duration:
-                            # Force process if recording too long
-                            is_recording = False
-                            speech_chunks = 0
-                            silence_chunks = 0
-
-                            if audio_buffer:
-                                full_audio = b''.join(audio_buffer)
-                                result = await service.process_audio_chunk(full_audio, target_language)
-
-                                if result:
-                                    await websocket.send_json({
-                                        "type": "translation",
-                                        **result
-                                    })
-
-                                audio_buffer = []
-
-            elif message.get("type") == "config":
-                # Update configuration
-                target_language = message.get("target_language", "zh")
-                await websocket.send_json({
-                    "type": "config_updated",
-                    "target_language": target_language
-                })
-
-            elif message.get("type") == "ping":
-                # Heartbeat
-                await websocket.send_json({
-                    "type": "pong",
-                    "timestamp": datetime.now().isoformat()
-                })
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            audio_bytes = message.get("bytes")
+            if audio_bytes is not None:
+                if session.container:
+                    await session.append_encoded(audio_bytes)
+                else:
+                    # Binary frames are raw 16-bit PCM, 16kHz mono
+                    await session.feed(audio_bytes)
+                continue
+
+            # Text frames are JSON control messages
+            await session.handle_control(json.loads(message.get("text") or "{}"))
 
     except WebSocketDisconnect:
         service.disconnect(websocket)
@@ -485,6 +721,103 @@ async def websocket_translate(websocket: WebSocket):
             await websocket.close()
         except:
             pass
+    finally:
+        session.close()
+
+@app.post("/rtc/offer")
+async def rtc_offer(offer: RTCOfferRequest):
+    """WebRTC signalling: answer a browser's SDP offer
+
+    The browser sends its microphone as an audio track, which aiortc decodes
+    and we feed into the same VAD pipeline as /ws/translate. Results and
+    control messages travel over a data channel the browser opens (any
+    label). Only SDP goes through this endpoint; the WebSocket remains the
+    transport for clients without WebRTC.
+    """
+    if not HAS_AIORTC:
+        raise HTTPException(status_code=501, detail="WebRTC transport requires aiortc")
+
+    pc = RTCPeerConnection()
+    peer_connections.add(pc)
+    channel = None
+
+    async def send(message: Dict):
+        # Replies produced before the data channel opens have nowhere to go
+        if channel is not None and channel.readyState == "open":
+            channel.send(json.dumps(message))
+
+    session = TranslationSession(send, offer.target_language)
+    session.start()
+
+    async def close_peer():
+        if pc not in peer_connections:
+            return  # Already closed
+        peer_connections.discard(pc)
+        session.close()
+        if channel_timer is not asyncio.current_task():
+            channel_timer.cancel()
+        await pc.close()
+
+    async def close_without_channel():
+        await asyncio.sleep(RTC_CHANNEL_TIMEOUT)
+        if channel is None:
+            print("WebRTC peer never opened a data channel")
+            await close_peer()
+
+    channel_timer = asyncio.create_task(close_without_channel())
+
+    @pc.on("datachannel")
+    def on_datachannel(dc):
+        nonlocal channel
+        channel = dc
+
+        @dc.on("open")
+        def on_open():
+            dc.send(json.dumps({
+                "type": "connected",
+                "message": "Real-time translation ready",
+                "initialized": service.is_initialized
+            }))
+
+        @dc.on("message")
+        async def on_message(data):
+            if not isinstance(data, str):
+                return
+            try:
+                await session.handle_control(json.loads(data or "{}"))
+            except Exception as e:
+                print(f"Data channel error: {e}")
+                await close_peer()
+
+    @pc.on("track")
+    def on_track(track):
+        if track.kind == "audio":
+            session.workers.append(asyncio.create_task(_pump_rtc_audio(track, session)))
+
+    @pc.on("connectionstatechange")
+    async def on_connectionstatechange():
+        if pc.connectionState in ("disconnected", "failed", "closed"):
+            await close_peer()
+
+    await pc.setRemoteDescription(RTCSessionDescription(sdp=offer.sdp, type=offer.type))
+    await pc.setLocalDescription(await pc.createAnswer())
+    return {"sdp": pc.localDescription.sdp, "type": pc.localDescription.type}
+
+async def _pump_rtc_audio(track, session: TranslationSession):
+    """Resample an inbound WebRTC track to 16kHz mono PCM and feed it in VAD-sized chunks"""
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=service.sample_rate)
+    chunk_bytes = service.chunk_size * 2  # webrtcvad only takes 10/20/30ms frames
+    pending = bytearray()
+    try:
+        while True:
+            frame = await track.recv()
+            for resampled in resampler.resample(frame):
+                pending.extend(resampled.to_ndarray().tobytes())
+            while len(pending) >= chunk_bytes:
+                await session.feed(bytes(pending[:chunk_bytes]))
+                del pending[:chunk_bytes]
+    except MediaStreamError:
+        pass  # Track ended
 
 if __name__ == "__main__":
     import uvicorn
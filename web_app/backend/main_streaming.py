@@ -7,10 +7,9 @@ Processes audio in real-time without waiting for silence
 import os
 import json
 import asyncio
-import io
-import wave
+import struct
 import time
-import base64
+import binascii
 import tempfile
 import numpy as np
 from datetime import datetime
@@ -24,6 +23,11 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+try:
+    from .core import _config_lock, _write_config
+except ImportError:  # run from inside backend/
+    from core import _config_lock, _write_config
+
 # Audio processing
 try:
     import webrtcvad
@@ -32,6 +36,16 @@ except ImportError:
     HAS_VAD = False
     print("Warning: webrtcvad not installed")
 
+# Audio frames arrive base64-encoded in JSON; decode with the SIMD pybase64 if
+# available, else binascii's C decoder directly (base64.b64decode wraps it)
+try:
+    from pybase64 import b64decode
+except ImportError:
+    b64decode = binascii.a2b_base64
+
+# RIFF/WAVE header for PCM uploads; packed per chunk instead of going through the wave module
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
 # Fireworks AI via OpenAI client
 try:
     from openai import OpenAI
@@ -92,6 +106,12 @@ class StreamingTranslationService:
         self.gemini_client = None
         self.is_initialized = False
 
+        # Translation prompt prefix per language code, built once
+        self._prompt_prefixes = {
+            code: f"Translate this to {name}, output only the translation, nothing else: "
+            for code, (name, _flag) in self.LANGUAGES.items()
+        }
+
         # Audio settings
         self.sample_rate = 16000
         self.chunk_duration = 2.0  # Process 2 seconds of audio at a time
@@ -161,17 +181,13 @@ class StreamingTranslationService:
         try:
             start_time = time.time()
 
-            # Create WAV file in memory to avoid Windows file locking issues
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(audio_data)
-
-            # Get WAV bytes
-            wav_buffer.seek(0)
-            wav_bytes = wav_buffer.read()
+            # audio_data is already 16-bit mono PCM: prepend the header, no temp file
+            data_len = len(audio_data)
+            wav_bytes = _WAV_HEADER.pack(
+                b"RIFF", 36 + data_len, b"WAVE",
+                b"fmt ", 16, 1, 1, self.sample_rate, self.sample_rate * 2, 2, 16,
+                b"data", data_len
+            ) + audio_data
 
             # Transcribe with Fireworks using bytes directly
             transcription = self.fireworks_client.audio.transcriptions.create(
@@ -193,8 +209,10 @@ class StreamingTranslationService:
             translation = text
             if self.gemini_client:
                 try:
-                    lang_name = self.LANGUAGES.get(target_language, (target_language, ''))[0]
-                    prompt = f"Translate this to {lang_name}, output only the translation, nothing else: {text}"
+                    prefix = self._prompt_prefixes.get(target_language)
+                    if prefix is None:
+                        prefix = f"Translate this to {target_language}, output only the translation, nothing else: "
+                    prompt = prefix + text
 
                     response = self.gemini_client.models.generate_content(
                         model="gemini-2.5-flash-lite",  # Use gemini-2.5-flash-lite as requested
@@ -315,8 +333,8 @@ async def update_config(config: ConfigRequest):
             'default_target_language': config.default_target_language
         }
 
-        with open('config.json', 'w') as f:
-            json.dump(config_data, f, indent=2)
+        async with _config_lock:
+            await asyncio.to_thread(_write_config, config_data)
 
         return {
             "status": "configured" if success else "failed",
@@ -389,7 +407,7 @@ async def websocket_stream(websocket: WebSocket):
 
                 if audio_base64:
                     # Decode base64 audio
-                    audio_bytes = base64.b64decode(audio_base64)
+                    audio_bytes = b64decode(audio_base64)
                     audio_buffer.extend(audio_bytes)
 
                     # Log for debugging
@@ -10,6 +10,12 @@ interface RealtimeTranslatorProps {
   apiConfig: { fireworks_api_key: string; gemini_api_key: string }
 }
 
+// Client-side speech gate on the analyser level: each utterance gets its own
+// MediaRecorder so the server receives one complete WebM file per utterance
+const SPEECH_LEVEL = 0.08
+const END_SILENCE_MS = 700
+const MAX_UTTERANCE_MS = 15000
+
 interface TranslationEntry {
   id: string
   transcription: string
@@ -45,6 +51,8 @@ export function RealtimeTranslator({
   const analyserRef = useRef<AnalyserNode | null>(null)
   const streamRef = useRef<MediaStream | null>(null)
   const animationFrameRef = useRef<number | null>(null)
+  const utteranceStartRef = useRef(0)
+  const lastVoiceRef = useRef(0)
   const translationsEndRef = useRef<HTMLDivElement>(null)
 
   // Auto-scroll to latest translation
@@ -56,7 +64,8 @@ export function RealtimeTranslator({
   const connectWebSocket = useCallback(() => {
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:'
     const host = window.location.hostname
-    const wsUrl = `${protocol}//${host}:8001/ws/translate`
+    // MediaRecorder produces WebM/Opus, not PCM: tell the server which codec to expect
+    const wsUrl = `${protocol}//${host}:8001/ws/translate?codec=webm`
 
     try {
       const ws = new WebSocket(wsUrl)
@@ -194,33 +203,15 @@ export function RealtimeTranslator({
       // Start visualization
       visualizeAudio()
 
-      // Setup MediaRecorder for chunked recording
-      const mediaRecorder = new MediaRecorder(stream, {
-        mimeType: 'audio/webm;codecs=opus'
-      })
-      mediaRecorderRef.current = mediaRecorder
-
-      // Send audio chunks to WebSocket
-      mediaRecorder.ondataavailable = async (event) => {
-        if (event.data.size > 0 && wsRef.current?.readyState === WebSocket.OPEN) {
-          // Convert blob to base64
-          const reader = new FileReader()
-          reader.onloadend = () => {
-            const base64 = reader.result?.toString().split(',')[1]
-            if (base64) {
-              wsRef.current?.send(JSON.stringify({
-                type: 'audio',
-                data: base64,
-                target_language: selectedLanguage
-              }))
-            }
-          }
-          reader.readAsDataURL(event.data)
-        }
+      // Target language is set once per session; audio goes out as binary frames
+      if (wsRef.current?.readyState === WebSocket.OPEN) {
+        wsRef.current.send(JSON.stringify({
+          type: 'config',
+          target_language: selectedLanguage
+        }))
       }
 
-      // Start recording with 100ms chunks
-      mediaRecorder.start(100)
+      // Utterances are recorded as visualizeAudio detects speech
       setIsRecording(true)
       setStatus('Listening...')
 
@@ -230,12 +221,48 @@ export function RealtimeTranslator({
     }
   }
 
-  // Stop recording
-  const stopRecording = () => {
-    if (mediaRecorderRef.current && isRecording) {
+  // Record one utterance: a fresh MediaRecorder so its blobs start with a WebM header
+  const startUtterance = () => {
+    if (!streamRef.current) return
+
+    const mediaRecorder = new MediaRecorder(streamRef.current, {
+      mimeType: 'audio/webm;codecs=opus'
+    })
+    mediaRecorderRef.current = mediaRecorder
+    utteranceStartRef.current = performance.now()
+
+    // Send audio chunks to WebSocket
+    mediaRecorder.ondataavailable = (event) => {
+      if (event.data.size > 0 && wsRef.current?.readyState === WebSocket.OPEN) {
+        wsRef.current.send(event.data)
+      }
+    }
+
+    // onstop fires after the last chunk, so the utterance is complete on the server
+    mediaRecorder.onstop = () => {
+      const duration = (performance.now() - utteranceStartRef.current) / 1000
+      if (wsRef.current?.readyState === WebSocket.OPEN) {
+        wsRef.current.send(JSON.stringify({ type: 'utterance_end', duration }))
+      }
+    }
+
+    // Start recording with 100ms chunks
+    mediaRecorder.start(100)
+    setIsListening(true)
+    setStatus('Listening - Speech detected')
+  }
+
+  const endUtterance = () => {
+    if (mediaRecorderRef.current) {
       mediaRecorderRef.current.stop()
       mediaRecorderRef.current = null
     }
+    setIsListening(false)
+  }
+
+  // Stop recording
+  const stopRecording = () => {
+    endUtterance()
 
     if (streamRef.current) {
       streamRef.current.getTracks().forEach(track => track.stop())
@@ -273,7 +300,19 @@ export function RealtimeTranslator({
 
     // Calculate average volume
     const average = dataArray.reduce((a, b) => a + b, 0) / dataArray.length
-    setAudioLevel(average / 255)
+    const level = average / 255
+    setAudioLevel(level)
+
+    // Start an utterance on speech, end it after trailing silence or at the cap
+    const now = performance.now()
+    if (level > SPEECH_LEVEL) {
+      lastVoiceRef.current = now
+      if (!mediaRecorderRef.current) startUtterance()
+    }
+    if (mediaRecorderRef.current && (now - lastVoiceRef.current > END_SILENCE_MS ||
+                                     now - utteranceStartRef.current > MAX_UTTERANCE_MS)) {
+      endUtterance()
+    }
 
     animationFrameRef.current = requestAnimationFrame(visualizeAudio)
   }
@@ -189,6 +189,17 @@ export function RealtimeTranslator({
               }])
               break
 
+            case 'transcription':
+              // Source text arrives before its translation; fill in the oldest pending entry
+              setTranslations(prev => {
+                const index = prev.findIndex(t => t.isProcessing)
+                if (index < 0) return prev
+                const newList = [...prev]
+                newList[index] = { ...newList[index], transcription: data.transcription }
+                return newList
+              })
+              break
+
             case 'translation':
               setStatus('Connected - Ready')
               console.log('Translation received:', data.transcription, '->', data.translation)
@@ -228,8 +239,11 @@ export function RealtimeTranslator({
             case 'error':
               console.error('Translation error:', data.message)
               setStatus(`Error: ${data.message}`)
-              // Remove processing entry on error
-              setTranslations(prev => prev.filter(t => !t.isProcessing))
+              // Remove the processing entry this error belongs to (the oldest one)
+              setTranslations(prev => {
+                const index = prev.findIndex(t => t.isProcessing)
+                return index < 0 ? prev : prev.filter((_, i) => i !== index)
+              })
               break
           }
         } catch (error) {
@@ -269,21 +283,19 @@ export function RealtimeTranslator({
       const recorder = new AudioRecorder()
       audioRecorderRef.current = recorder
 
+      // Target language is set once per session; audio frames are raw PCM
+      if (wsRef.current?.readyState === WebSocket.OPEN) {
+        wsRef.current.send(JSON.stringify({
+          type: 'config',
+          target_language: selectedLanguage
+        }))
+      }
+
       // Start recording with callback
       await recorder.start((audioData) => {
         if (wsRef.current?.readyState === WebSocket.OPEN) {
-          // Convert ArrayBuffer to base64
-          const bytes = new Uint8Array(audioData)
-          let binary = ''
-          bytes.forEach(byte => binary += String.fromCharCode(byte))
-          const base64 = btoa(binary)
-
-          // Send to WebSocket
-          wsRef.current.send(JSON.stringify({
-            type: 'audio',
-            data: base64,
-            target_language: selectedLanguage
-          }))
+          // Send PCM as a binary frame
+          wsRef.current.send(audioData)
         }
       })
 